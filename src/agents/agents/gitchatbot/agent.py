@@ -1,4 +1,6 @@
-from typing import cast
+from collections.abc import Awaitable, Callable
+from typing import TypeVar, cast
+import asyncio
 
 from pydantic_ai import Agent as PydanticAgent
 from pydantic_ai import RunContext
@@ -25,6 +27,26 @@ from integrations.git.git_repository import GitRepository
 
 AGENT_NAME = "gitchatbot"
 
+_T = TypeVar("_T")
+
+# ChatbotContext fields reported back to the model after update_context
+CONTEXT_SUMMARY_FIELDS = (
+    "issue_id",
+    "pull_request_id",
+    "source_git_ref",
+    "target_git_ref",
+    "project",
+)
+
+
+async def _load_if_set(
+    item_id: object, load: Callable[[str], Awaitable[_T]]
+) -> _T | None:
+    """Return ``await load(str(item_id))``, or None when *item_id* is not set."""
+    if not item_id:
+        return None
+    return await load(str(item_id))
+
 
 class GitChatbotAgent(PydanticAIAgent):
     """Chatbot agent that responds to user messages using AI and subagents."""
@@ -36,6 +58,10 @@ class GitChatbotAgent(PydanticAIAgent):
         base_config = get_current_config()
         self.config = GitChatbotAgentConfig(base_config)
 
+        # Resolve config-derived collaborators once for all tool calls
+        self._base_config = base_config
+        self._storage = get_storage(base_config)
+
         # Get prompts
         base_prompts = get_current_prompts()
         self.prompts = GitChatbotAgentPrompts(base_prompts)
@@ -51,17 +77,14 @@ class GitChatbotAgent(PydanticAIAgent):
         Returns:
             PersistentAgentDeps with storage and execution_id configured
         """
-        # Get global storage instance
-        storage = get_storage(get_current_config())
-
         # Get execution ID from context
         execution_id = get_current_agent_execution_context().get_execution_id()
 
         # Create persistent dependencies
-        deps = PersistentAgentDeps(execution_id=execution_id, storage=storage)
+        deps = PersistentAgentDeps(execution_id=execution_id, storage=self._storage)
 
         # Load existing context to make it available
-        deps.context = deps.load_context()
+        deps.load_context()
 
         return deps
 
@@ -119,39 +142,19 @@ class GitChatbotAgent(PydanticAIAgent):
             Returns:
                 Confirmation message about context update
             """
-            self.logger.info(
-                f"update_context tool called with: issue_id={context.issue_id}, "
-                f"pull_request_id={context.pull_request_id}, "
-                f"source_git_ref={context.source_git_ref}, "
-                f"target_git_ref={context.target_git_ref}, "
-                f"project={context.project}"
-            )
-
             ctx.deps.save_context(context)
 
-            # Log the updated context
+            # Create a summary of what was updated
+            updated_fields = [
+                f"{name}: {value}"
+                for name in CONTEXT_SUMMARY_FIELDS
+                if (value := getattr(context, name))
+            ]
+
             self.logger.info(
-                f"Context updated and saved. Current context: "
-                f"issue_id={context.issue_id}, "
-                f"pull_request_id={context.pull_request_id}, "
-                f"source_git_ref={context.source_git_ref}, "
-                f"target_git_ref={context.target_git_ref}, "
-                f"project={context.project}"
+                f"update_context tool called, context saved: {', '.join(updated_fields)}"
             )
 
-            # Create a summary of what was updated
-            updated_fields = []
-            if context.issue_id:
-                updated_fields.append(f"issue_id: {context.issue_id}")
-            if context.pull_request_id:
-                updated_fields.append(f"pull_request_id: {context.pull_request_id}")
-            if context.source_git_ref:
-                updated_fields.append(f"source_git_ref: {context.source_git_ref}")
-            if context.target_git_ref:
-                updated_fields.append(f"target_git_ref: {context.target_git_ref}")
-            if context.project:
-                updated_fields.append(f"project: {context.project}")
-
             # Fetch additional context from project loader
             additional_context_parts: list[str] = []
 
@@ -162,33 +165,37 @@ class GitChatbotAgent(PydanticAIAgent):
             except ConfigurationError as e:
                 return str(e)
 
-            # Load pull request context if PR ID is provided
-            if context.pull_request_id:
-                try:
-                    pr_model = await project_loader.load_pullrequest(
-                        str(context.pull_request_id)
-                    )
-                    additional_context_parts.append(
-                        f"Pull Request #{context.pull_request_id}: {pr_model.context}"
-                    )
-                except Exception as e:
-                    self.logger.warning(
-                        f"Could not load pull request #{context.pull_request_id}: {e}"
-                    )
+            # Pull request and issue are independent provider round-trips,
+            # so both are loaded at the same time
+            pr_result, issue_result = await asyncio.gather(
+                _load_if_set(context.pull_request_id, project_loader.load_pullrequest),
+                _load_if_set(context.issue_id, project_loader.load_issue),
+                return_exceptions=True,
+            )
 
-            # Load issue context if issue ID is provided
-            if context.issue_id:
-                try:
-                    issue_model = await project_loader.load_issue(str(context.issue_id))
-                    additional_context_parts.append(
-                        f"Issue #{context.issue_id}: {issue_model.context}"
-                    )
-                except Exception as e:
-                    import traceback
+            if isinstance(pr_result, BaseException):
+                self.logger.warning(
+                    "Could not load pull request #%s: %s",
+                    context.pull_request_id,
+                    pr_result,
+                    exc_info=pr_result,
+                )
+            elif pr_result is not None:
+                additional_context_parts.append(
+                    f"Pull Request #{context.pull_request_id}: {pr_result.context}"
+                )
 
-                    self.logger.warning(
-                        f"Could not load issue #{context.issue_id}: {e}\nFull traceback:\n{traceback.format_exc()}"
-                    )
+            if isinstance(issue_result, BaseException):
+                self.logger.warning(
+                    "Could not load issue #%s: %s",
+                    context.issue_id,
+                    issue_result,
+                    exc_info=issue_result,
+                )
+            elif issue_result is not None:
+                additional_context_parts.append(
+                    f"Issue #{context.issue_id}: {issue_result.context}"
+                )
 
             # Build the response message
             if updated_fields:
@@ -261,7 +268,7 @@ class GitChatbotAgent(PydanticAIAgent):
             self.logger.info("list_artifacts tool called")
 
             try:
-                current_context = ctx.deps.load_context()
+                current_context = ctx.deps.context or ctx.deps.load_context()
 
                 if not current_context.artifact_ids:
                     return "No artifacts available."
@@ -286,7 +293,7 @@ class GitChatbotAgent(PydanticAIAgent):
             # Check if configured
             from agents.subagents.claude_code import ClaudeCodeConfig
 
-            claude_config = ClaudeCodeConfig(get_current_config())
+            claude_config = ClaudeCodeConfig(self._base_config)
             return claude_config.is_configured()
         except ImportError:
             return False
@@ -398,7 +405,7 @@ class GitChatbotAgent(PydanticAIAgent):
         self.logger.info(f"list_recent_tags tool called with limit={limit}")
 
         try:
-            current_context = sc.deps.load_context()
+            current_context = sc.deps.context or sc.deps.load_context()
 
             # Get project-specific loader
             try:
@@ -414,8 +421,9 @@ class GitChatbotAgent(PydanticAIAgent):
             if limit > 50:
                 limit = 50  # Cap at reasonable maximum
 
-            git_repo = GitRepository(project_config=project_config)
-            tags = git_repo.get_latest_tags(limit=limit)
+            # Git runs in a worker thread so the event loop is not blocked
+            git_repo = await asyncio.to_thread(GitRepository, project_config)
+            tags = await asyncio.to_thread(git_repo.get_latest_tags, limit=limit)
 
             if not tags:
                 return "No git tags found in the repository."
@@ -452,7 +460,7 @@ class GitChatbotAgent(PydanticAIAgent):
         self.logger.info("research_codebase tool called")
 
         try:
-            current_context = sc.deps.load_context()
+            current_context = sc.deps.context or sc.deps.load_context()
 
             try:
                 project_loader = sc.get_selected_project(current_context.project)
@@ -461,7 +469,8 @@ class GitChatbotAgent(PydanticAIAgent):
                 return str(e)
 
             project_config = project_loader.get_project_config()
-            git_repo = GitRepository(project_config=project_config)
+            # May auto-pull; keep it off the event loop
+            git_repo = await asyncio.to_thread(GitRepository, project_config)
 
             context_description = None
             source_branch = None
@@ -472,29 +481,33 @@ class GitChatbotAgent(PydanticAIAgent):
                     f"Researching codebase for PR #{current_context.pull_request_id}"
                 )
 
-                (
-                    source_branch,
-                    target_branch,
-                ) = await project_loader.get_branches_from_pr(
-                    current_context.pull_request_id
+                # The issue does not depend on the PR, so load it alongside
+                branches_result, issue_result = await asyncio.gather(
+                    project_loader.get_branches_from_pr(
+                        current_context.pull_request_id
+                    ),
+                    _load_if_set(current_context.issue_id, project_loader.load_issue),
+                    return_exceptions=True,
                 )
+                if isinstance(branches_result, BaseException):
+                    raise branches_result
+                source_branch, target_branch = branches_result
 
                 context_description = f"Pull Request #{current_context.pull_request_id}"
 
-                if current_context.issue_id:
-                    try:
-                        issue_model = await project_loader.load_issue(
-                            str(current_context.issue_id)
-                        )
-                        issue_title = f"Issue #{current_context.issue_id}"
-                        context_description = (
-                            f"Pull Request #{current_context.pull_request_id} - {issue_title}\n\n"
-                            + issue_model.context
-                        )
-                    except Exception as e:
-                        self.logger.warning(
-                            f"Could not load issue #{current_context.issue_id}: {e}"
-                        )
+                if isinstance(issue_result, BaseException):
+                    self.logger.warning(
+                        "Could not load issue #%s: %s",
+                        current_context.issue_id,
+                        issue_result,
+                        exc_info=issue_result,
+                    )
+                elif issue_result is not None:
+                    issue_title = f"Issue #{current_context.issue_id}"
+                    context_description = (
+                        f"Pull Request #{current_context.pull_request_id} - {issue_title}\n\n"
+                        + issue_result.context
+                    )
 
             elif current_context.source_git_ref and current_context.target_git_ref:
                 source_branch = current_context.source_git_ref
@@ -559,7 +572,7 @@ class GitChatbotAgent(PydanticAIAgent):
         self.logger.info("code_research tool called")
 
         try:
-            current_context = sc.deps.load_context()
+            current_context = sc.deps.context or sc.deps.load_context()
 
             try:
                 project_loader = sc.get_selected_project(current_context.project)
@@ -568,7 +581,8 @@ class GitChatbotAgent(PydanticAIAgent):
                 return str(e)
 
             project_config = project_loader.get_project_config()
-            git_repo = GitRepository(project_config=project_config)
+            # May auto-pull; keep it off the event loop
+            git_repo = await asyncio.to_thread(GitRepository, project_config)
 
             # Determine git ref and context description
             if current_context.pull_request_id:
@@ -590,7 +604,7 @@ class GitChatbotAgent(PydanticAIAgent):
             )
             from core.agents import run_agent_safely
 
-            code_research_config = CodeResearchConfig(get_current_config())
+            code_research_config = CodeResearchConfig(self._base_config)
             model = code_research_config.get_model()
             num_retries = code_research_config.get_num_retries()
             system_prompt = self.prompts.get_code_research_prompt()
@@ -643,8 +657,7 @@ User Instructions:
         if days < 1:
             return "Days must be a positive number."
 
-        storage = get_storage(get_current_config())
-        usage_storage = get_usage_storage(storage)
+        usage_storage = get_usage_storage(self._storage)
         usages = usage_storage.load_usage(days)
         return usage_storage.format_usage(usages)
 
@@ -50,13 +50,21 @@ class PersistentAgentDeps:
     def load_context(self) -> ChatbotContext:
         """Load context from storage or create new one.
 
+        The loaded context is memoized on ``self.context`` so repeated tool calls
+        within one run do not round-trip through storage again. ``save_context``
+        keeps the memoized value in sync.
+
         Returns:
             ChatbotContext instance loaded from storage or new empty context
         """
+        if self.context is not None:
+            return self.context
+
         stored_data = self.storage.get(self.get_storage_key())
-        if stored_data:
-            return ChatbotContext(**stored_data)
-        return ChatbotContext()
+        self.context = (
+            ChatbotContext(**stored_data) if stored_data else ChatbotContext()
+        )
+        return self.context
 
     def save_context(self, context: ChatbotContext) -> None:
         """Save context to storage.
@@ -64,14 +72,6 @@ class PersistentAgentDeps:
         Args:
             context: ChatbotContext to save
         """
-        # Convert dataclass to dict for JSON serialization
-        context_data = {
-            "issue_id": context.issue_id,
-            "pull_request_id": context.pull_request_id,
-            "source_git_ref": context.source_git_ref,
-            "target_git_ref": context.target_git_ref,
-            "artifact_ids": context.artifact_ids,
-            "project": context.project,
-        }
-        self.storage.set(self.get_storage_key(), context_data)
+        # Dataclass fields live in __dict__, which is already JSON serializable
+        self.storage.set(self.get_storage_key(), context.__dict__)
         self.context = context
@@ -65,15 +65,17 @@ class PydanticAIAgent(Agent):
             return
 
         last_model_response = ctx.messages[-1]
-        text_part = next(
-            (part for part in last_model_response.parts if part.part_kind == "text"),
-            None,
-        )
+        text_part = None
+        for part in last_model_response.parts:
+            if part.part_kind == "text":
+                text_part = part
+                break
+
+        context = get_current_agent_execution_context()
         if text_part:
-            response_text = text_part.content
-            await get_current_agent_execution_context().send_response(response_text)
+            await context.send_response(text_part.content)
         elif fallback_message:
-            await get_current_agent_execution_context().send_status(fallback_message)
+            await context.send_status(fallback_message)
 
     async def run(self) -> str:
         """Execute the agent using standard PydanticAI flow.
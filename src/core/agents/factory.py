@@ -16,6 +16,8 @@ class SimpleAgentFactory:
     Follows the Factory pattern for centralized agent creation.
     """
 
+    __slots__ = ("_agent_registry",)
+
     def __init__(self) -> None:
         self._agent_registry: dict[str, Callable[[], type[Agent]]] = {}
 
@@ -29,10 +31,10 @@ class SimpleAgentFactory:
             factory_func: Function that creates and configures the agent
         """
         if agent_type in self._agent_registry:
-            logger.warning(f"Overriding existing agent registration: {agent_type}")
+            logger.warning("Overriding existing agent registration: %s", agent_type)
 
         self._agent_registry[agent_type] = factory_func
-        logger.info(f"Registered agent type: {agent_type}")
+        logger.info("Registered agent type: %s", agent_type)
 
     def create_agent(self, agent_type: str) -> type[Agent]:
         """Create an agent class of the specified type.
@@ -47,7 +49,8 @@ class SimpleAgentFactory:
             AgentNotFoundError: If agent type is not registered
             AgentConfigurationError: If agent creation fails
         """
-        if agent_type not in self._agent_registry:
+        factory_func = self._agent_registry.get(agent_type)
+        if factory_func is None:
             available_types = list(self._agent_registry.keys())
             raise AgentNotFoundError(
                 f"Agent type '{agent_type}' not found. Available types: {available_types}",
@@ -55,9 +58,8 @@ class SimpleAgentFactory:
             )
 
         try:
-            factory_func = self._agent_registry[agent_type]
             agent_class = factory_func()
-            logger.info(f"Retrieved agent class: type={agent_type}")
+            logger.info("Retrieved agent class: type=%s", agent_type)
             return agent_class
 
         except Exception as e:
@@ -1,18 +1,229 @@
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any, Optional, cast
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Optional
+import functools
 import os
+import re
 import threading
 
-from dotenv import load_dotenv
-from dynaconf import Dynaconf
-
 from core.exceptions import ConfigurationError
 from core.log import get_logger
 from core.project_config import ProjectConfig
 
-load_dotenv()
+if TYPE_CHECKING:
+    from dynaconf import Dynaconf
+
 logger = get_logger("BaseConfig")
 
+_dotenv_loaded = False
+
+
+def ensure_dotenv_loaded() -> None:
+    """Load the .env file into the environment before the first config load.
+
+    Deferred from import time so that importing ``core.config`` does not pull in
+    python-dotenv (or Dynaconf) until configuration is actually read.
+    """
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _dotenv_loaded = True
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_key_path(key_path: str) -> tuple[tuple[str, ...], str, str]:
+    """Split a dot-notation key once into its segments and env-var names.
+
+    Returns:
+        Tuple of (segments, ``A_B_C`` env key, ``A__B__C`` Dynaconf env key)
+    """
+    segments = tuple(key_path.split("."))
+    return segments, "_".join(segments).upper(), "__".join(segments).upper()
+
+
+def lookup_key_path(data: dict[str, Any], key_path: str) -> Any:
+    """Resolve a dot-separated key path against resolved Dynaconf data.
+
+    Mirrors Dynaconf's case-insensitive access: each segment is matched as
+    written first, then upper-cased (Dynaconf stores top-level keys upper-case),
+    then by a case-insensitive scan of the keys at that level.
+
+    Args:
+        data: Resolved configuration data (e.g. from ``Dynaconf.to_dict()``)
+        key_path: Dot-separated path to the value
+
+    Returns:
+        The value at the path, or None if any segment is missing
+    """
+    value: Any = data
+    for key in _compile_key_path(key_path)[0]:
+        if not isinstance(value, dict):
+            return None
+        if key in value:
+            value = value[key]
+        elif (upper := key.upper()) in value:
+            value = value[upper]
+        else:
+            lower = key.lower()
+            value = next((v for k, v in value.items() if str(k).lower() == lower), None)
+    return value
+
+
+# Environment variables read by a template, in attribute, get() or subscript
+# form (the latter also unquoted, as used by @format)
+_ENV_REFERENCE = re.compile(
+    r"""\benv(?:\.get\(\s*['"](\w+)['"]|\[\s*['"]?(\w+)['"]?\s*\]|\.(?!get\b)(\w+))"""
+)
+# Other settings read by a template: this.section.key
+_THIS_REFERENCE = re.compile(r"\bthis\.(\w+(?:\.\w+)*)")
+_CONTEXT_NAME = re.compile(r"\b(?:env|this)\b")
+
+
+def template_env_dependencies(
+    settings: "Dynaconf",
+) -> dict[str, frozenset[str] | None]:
+    """Map templated key paths to the environment variables their values read.
+
+    Key paths are lower-cased and include every section containing a template,
+    with the union of its children's variables. References to other settings
+    (``this.path``) contribute the variables of the referenced keys. A path maps
+    to None when its inputs cannot be determined from the template text.
+
+    Args:
+        settings: Loaded Dynaconf settings
+
+    Returns:
+        Dict of dot-separated key path to variable names (or None)
+    """
+    from dynaconf.utils.parse_conf import Lazy
+
+    templates: dict[str, list[str]] = {}
+
+    def collect(value: Any, path: str) -> None:
+        if isinstance(value, Lazy):
+            templates.setdefault(path, []).append(str(value.value))
+        elif isinstance(value, dict):
+            for key, child in value.items():
+                collect(child, f"{path}.{key}".lower() if path else str(key).lower())
+        elif isinstance(value, list):
+            for child in value:
+                collect(child, path)
+
+    collect(settings.store, "")
+
+    leaves: dict[str, frozenset[str] | None] = {}
+    resolving: set[str] = set()
+
+    def union(groups: list[frozenset[str] | None]) -> frozenset[str] | None:
+        names: set[str] = set()
+        for group in groups:
+            if group is None:
+                return None
+            names.update(group)
+        return frozenset(names)
+
+    def referenced(path: str) -> frozenset[str] | None:
+        if path in templates:
+            return leaf(path)
+        return union([leaf(p) for p in templates if p.startswith(f"{path}.")])
+
+    def leaf(path: str) -> frozenset[str] | None:
+        if path in leaves:
+            return leaves[path]
+        if path in resolving:
+            return None
+        resolving.add(path)
+        groups: list[frozenset[str] | None] = []
+        for template in templates[path]:
+            env_refs = _ENV_REFERENCE.findall(template)
+            this_refs = _THIS_REFERENCE.findall(template)
+            if len(_CONTEXT_NAME.findall(template)) != len(env_refs) + len(this_refs):
+                groups.append(None)
+                continue
+            groups.append(frozenset(name for ref in env_refs for name in ref if name))
+            groups.extend(referenced(ref.lower()) for ref in this_refs)
+        resolving.discard(path)
+        leaves[path] = union(groups)
+        return leaves[path]
+
+    dependencies: dict[str, frozenset[str] | None] = {}
+    for path in templates:
+        deps = leaf(path)
+        segments = path.split(".")
+        for depth in range(1, len(segments) + 1):
+            prefix = ".".join(segments[:depth])
+            if prefix in dependencies:
+                dependencies[prefix] = union([dependencies[prefix], deps])
+            else:
+                dependencies[prefix] = deps
+    return dependencies
+
+
+class TemplateValueCache:
+    """Serves templated Dynaconf values without re-rendering them on every read.
+
+    Dynaconf renders ``@jinja``/``@format`` values on each access, which costs
+    hundreds of microseconds. Rendered values are kept together with the
+    environment variables they read and reused until one of those changes, so
+    templated keys still follow the environment. Templates whose inputs are
+    unknown are rendered on every access.
+    """
+
+    def __init__(self, settings: "Dynaconf") -> None:
+        self._settings = settings
+        self._dependencies = {
+            path: tuple(sorted(deps)) if deps is not None else None
+            for path, deps in template_env_dependencies(settings).items()
+        }
+        # Every variable any template reads, for checks on the full data
+        all_deps = list(self._dependencies.values())
+        self._all_dependencies = (
+            tuple(sorted({name for deps in all_deps if deps for name in deps}))
+            if None not in all_deps
+            else None
+        )
+        # key path -> (environment values it was rendered with, rendered value)
+        self._rendered: dict[str, tuple[tuple[str | None, ...], Any]] = {}
+
+    def env_state(self) -> tuple[str | None, ...] | None:
+        """Return the current values of all environment variables read by templates.
+
+        Returns:
+            Tuple of variable values, or None if some template's inputs are unknown
+        """
+        if self._all_dependencies is None:
+            return None
+        return tuple(map(os.environ.get, self._all_dependencies))
+
+    def lookup(self, data: dict[str, Any], key_path: str) -> Any:
+        """Resolve *key_path*, rendering it through Dynaconf if it is templated.
+
+        Args:
+            data: Resolved settings data used for keys without templates
+            key_path: Dot-separated path to the value
+
+        Returns:
+            The (rendered) value, or None if the key is missing
+        """
+        key = key_path.lower()
+        if key not in self._dependencies:
+            return lookup_key_path(data, key_path)
+
+        deps = self._dependencies[key]
+        if deps is None:
+            return self._settings.get(key_path, None)
+
+        env_values = tuple(map(os.environ.get, deps))
+        cached = self._rendered.get(key)
+        if cached is not None and cached[0] == env_values:
+            return cached[1]
+        value = self._settings.get(key_path, None)
+        self._rendered[key] = (env_values, value)
+        return value
+
 
 class BaseConfig:
     """Base configuration class that loads and resolves YAML config with environment variables using Dynaconf."""
@@ -20,6 +231,8 @@ class BaseConfig:
     _config_path: str
     _settings: Any
     _config_data: dict[str, Any]
+    _config_view: tuple[tuple[str | None, ...] | None, Mapping[str, Any]]
+    _templates: TemplateValueCache
 
     def __init__(
         self,
@@ -31,6 +244,8 @@ class BaseConfig:
             self._config_path = base_config._config_path
             self._settings = base_config._settings
             self._config_data = base_config._config_data
+            self._config_view = base_config._config_view
+            self._templates = base_config._templates
         else:
             # Normal constructor: load config from path
             if config_path is None:
@@ -40,19 +255,17 @@ class BaseConfig:
 
             self._config_path = config_path
             self._settings = self._load_config()
-            # Keep backward compatibility for tests
-            try:
-                self._config_data = self._settings.to_dict()
-            except Exception as e:
-                logger.exception(f"Failed to load config: {e}")
-                # Fallback to basic dict if to_dict() fails
-                self._config_data = {}
-
-    def _load_config(self) -> Dynaconf:
+            self._templates = TemplateValueCache(self._settings)
+            self._resolve_config_data()
+
+    def _load_config(self) -> "Dynaconf":
         """Load and resolve the YAML configuration file using Dynaconf."""
         if not Path(self._config_path).exists():
             raise FileNotFoundError(f"Config file not found: {self._config_path}")
 
+        ensure_dotenv_loaded()
+        from dynaconf import Dynaconf
+
         # Use Dynaconf to load config with environment variable resolution
         settings = Dynaconf(
             settings_files=[
@@ -72,18 +285,34 @@ class BaseConfig:
         )
         return settings
 
-    def get_config_data(self) -> dict[str, Any]:
-        """Get the full resolved configuration data."""
-        try:
-            return cast("dict[str, Any]", self._settings.to_dict())
-        except Exception:
-            # Fallback to cached data if to_dict() fails
-            return self._config_data
+    def _resolve_config_data(self) -> None:
+        """Resolve the full configuration for the current environment."""
+        env_state = self._templates.env_state()
+        self._config_data = self._settings.to_dict()
+        self._config_view = (env_state, MappingProxyType(self._config_data))
+
+    def get_config_data(self) -> Mapping[str, Any]:
+        """Get the full resolved configuration data as a read-only view.
+
+        The data is resolved once and shared between calls. Like get_value(),
+        ``@jinja`` values follow the environment: the data is resolved again
+        when an environment variable read by a template has changed.
+        """
+        env_state, view = self._config_view
+        if env_state is None or env_state != self._templates.env_state():
+            self._resolve_config_data()
+            view = self._config_view[1]
+        return view
 
     def get_value(self, key_path: str, default: Any = None) -> Any:
         """
         Get a value from the config using dot notation.
 
+        Plain values are read from the configuration resolved at load time, so
+        lookups are dict walks. Keys backed by ``@jinja`` templates are rendered
+        again whenever an environment variable they read changes, so they
+        follow environment changes made after loading.
+
         Args:
             key_path: Dot-separated path to the config value (e.g., 'azure.devops.pat')
             default: Default value if key is not found
@@ -91,28 +320,23 @@ class BaseConfig:
         Returns:
             The configuration value or default
         """
-        try:
-            # First try Dynaconf's dot notation
-            value = self._settings.get(key_path, None)
-            if value is not None:
-                return value
-
-            # If not found, try environment variables
-            # Convert dot notation to environment variable format
-            env_key = key_path.replace(".", "_").upper()
-            env_value = os.getenv(env_key)
-            if env_value is not None:
-                return env_value
-
-            # Try Dynaconf's double underscore format
-            dynaconf_key = key_path.replace(".", "__").upper()
-            dynaconf_value = os.getenv(dynaconf_key)
-            if dynaconf_value is not None:
-                return dynaconf_value
-
-            return default
-        except Exception:
-            return default
+        # First try the configuration data
+        value = self._templates.lookup(self._config_data, key_path)
+        if value is not None:
+            return value
+
+        # If not found, try environment variables in dot-to-underscore
+        # and Dynaconf's double underscore formats
+        _, env_key, dynaconf_key = _compile_key_path(key_path)
+        env_value = os.getenv(env_key)
+        if env_value is not None:
+            return env_value
+
+        dynaconf_value = os.getenv(dynaconf_key)
+        if dynaconf_value is not None:
+            return dynaconf_value
+
+        return default
 
     def get_available_projects(self) -> list[str]:
         """Get list of configured project names."""
@@ -160,9 +384,10 @@ class BaseConfig:
         clone = object.__new__(type(self))
         clone._config_path = self._config_path
         clone._settings = self._settings.dynaconf_clone()
-        clone._config_data = {}
         if Path(overlay_path).exists():
             clone._settings.load_file(path=overlay_path)
+        clone._templates = TemplateValueCache(clone._settings)
+        clone._resolve_config_data()
         return clone
 
 
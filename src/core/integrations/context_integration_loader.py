@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 from core.integrations.provider_registry import ProviderRegistry
@@ -113,9 +114,11 @@ class ContextIntegrationLoader:
         """
         pr_model = await self.load_pullrequest(pullrequest_id)
 
-        # Extract branch information from the model using refs lists
-        source_branch = self._resolve_refs_to_branch(pr_model.source_refs)
-        target_branch = self._resolve_refs_to_branch(pr_model.target_refs)
+        # Extract branch information from the model using refs lists; this runs
+        # git, so it happens in a worker thread instead of on the event loop
+        source_branch, target_branch = await asyncio.to_thread(
+            self._resolve_pr_branches, pr_model
+        )
 
         if not source_branch or not target_branch:
             raise ValueError(
@@ -124,8 +127,14 @@ class ContextIntegrationLoader:
 
         return source_branch, target_branch
 
-    def _resolve_refs_to_branch(self, refs: list[str]) -> str | None:
-        return GitRepository(self.project_config).resolve_refs_to_branch(refs)
+    def _resolve_pr_branches(
+        self, pr_model: PullRequestModel
+    ) -> tuple[str | None, str | None]:
+        git_repo = GitRepository(self.project_config)
+        return (
+            git_repo.resolve_refs_to_branch(pr_model.source_refs),
+            git_repo.resolve_refs_to_branch(pr_model.target_refs),
+        )
 
     def get_project_config(self) -> ProjectConfig:
         """Get the project configuration for this loader.
@@ -1,5 +1,6 @@
 from collections.abc import Callable
 from typing import Any, TypeVar
+import weakref
 
 from core.log import get_logger
 from core.project_config import ProjectConfig
@@ -17,6 +18,15 @@ T = TypeVar("T")
 class ProviderRegistry:
     """Registry for managing provider implementations and resolving them from configuration."""
 
+    __slots__ = (
+        "_pullrequest_providers",
+        "_issue_providers",
+        "_pipeline_providers",
+        "_pullrequest_cache",
+        "_issue_cache",
+        "_pipeline_cache",
+    )
+
     def __init__(self) -> None:
         self._pullrequest_providers: dict[
             str, Callable[[dict[str, Any]], PullRequestProvider | None]
@@ -28,6 +38,17 @@ class ProviderRegistry:
             str, Callable[[dict[str, Any]], PipelineProvider | None]
         ] = {}
 
+        # Resolved providers per ProjectConfig, dropped with the config object
+        self._pullrequest_cache: weakref.WeakKeyDictionary[
+            ProjectConfig, PullRequestProvider
+        ] = weakref.WeakKeyDictionary()
+        self._issue_cache: weakref.WeakKeyDictionary[ProjectConfig, IssueProvider] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._pipeline_cache: weakref.WeakKeyDictionary[
+            ProjectConfig, PipelineProvider
+        ] = weakref.WeakKeyDictionary()
+
     def register_pullrequest_provider(
         self,
         name: str,
@@ -40,7 +61,8 @@ class ProviderRegistry:
             factory: Factory function that takes config dict and returns provider or None
         """
         self._pullrequest_providers[name] = factory
-        logger.debug(f"Registered pull request provider: {name}")
+        self._pullrequest_cache.clear()
+        logger.debug("Registered pull request provider: %s", name)
 
     def register_issue_provider(
         self, name: str, factory: Callable[[dict[str, Any]], IssueProvider | None]
@@ -52,7 +74,8 @@ class ProviderRegistry:
             factory: Factory function that takes config dict and returns provider or None
         """
         self._issue_providers[name] = factory
-        logger.debug(f"Registered issue provider: {name}")
+        self._issue_cache.clear()
+        logger.debug("Registered issue provider: %s", name)
 
     def register_pipeline_provider(
         self, name: str, factory: Callable[[dict[str, Any]], PipelineProvider | None]
@@ -64,7 +87,8 @@ class ProviderRegistry:
             factory: Factory function that takes config dict and returns provider or None
         """
         self._pipeline_providers[name] = factory
-        logger.debug(f"Registered pipeline provider: {name}")
+        self._pipeline_cache.clear()
+        logger.debug("Registered pipeline provider: %s", name)
 
     def resolve_pullrequest_provider(
         self, project_config: ProjectConfig
@@ -72,6 +96,7 @@ class ProviderRegistry:
         """Resolve a pull request provider from project configuration.
 
         Tries all registered providers in order until one matches the configuration.
+        The resolved provider is cached per project configuration.
 
         Args:
             project_config: Project configuration
@@ -79,10 +104,17 @@ class ProviderRegistry:
         Returns:
             First matching provider or None if no provider matches
         """
+        cached = self._pullrequest_cache.get(project_config)
+        if cached is not None:
+            return cached
+
         provider_configs = project_config.get_pullrequest_providers()
-        return self._resolve_provider(
+        provider = self._resolve_provider(
             self._pullrequest_providers, provider_configs, "pull request"
         )
+        if provider is not None:
+            self._pullrequest_cache[project_config] = provider
+        return provider
 
     def resolve_issue_provider(
         self, project_config: ProjectConfig
@@ -90,6 +122,7 @@ class ProviderRegistry:
         """Resolve an issue provider from project configuration.
 
         Tries all registered providers in order until one matches the configuration.
+        The resolved provider is cached per project configuration.
 
         Args:
             project_config: Project configuration
@@ -97,8 +130,17 @@ class ProviderRegistry:
         Returns:
             First matching provider or None if no provider matches
         """
+        cached = self._issue_cache.get(project_config)
+        if cached is not None:
+            return cached
+
         provider_configs = project_config.get_issue_providers()
-        return self._resolve_provider(self._issue_providers, provider_configs, "issue")
+        provider = self._resolve_provider(
+            self._issue_providers, provider_configs, "issue"
+        )
+        if provider is not None:
+            self._issue_cache[project_config] = provider
+        return provider
 
     def resolve_pipeline_provider(
         self, project_config: ProjectConfig
@@ -106,6 +148,7 @@ class ProviderRegistry:
         """Resolve a pipeline provider from project configuration.
 
         Tries all registered providers in order until one matches the configuration.
+        The resolved provider is cached per project configuration.
 
         Args:
             project_config: Project configuration
@@ -113,10 +156,17 @@ class ProviderRegistry:
         Returns:
             First matching provider or None if no provider matches
         """
+        cached = self._pipeline_cache.get(project_config)
+        if cached is not None:
+            return cached
+
         provider_configs = project_config.get_pipeline_providers()
-        return self._resolve_provider(
+        provider = self._resolve_provider(
             self._pipeline_providers, provider_configs, "pipeline"
         )
+        if provider is not None:
+            self._pipeline_cache[project_config] = provider
+        return provider
 
     def get_registered_pullrequest_providers(self) -> list[str]:
         """Get list of registered pull request provider names."""
@@ -147,22 +197,26 @@ class ProviderRegistry:
             First matching provider or None if no provider matches
         """
         for provider_name, provider_config in provider_configs.items():
-            if provider_name in providers_registry:
-                factory = providers_registry[provider_name]
-                try:
-                    provider = factory(provider_config)
-                    if provider is not None:
-                        logger.info(
-                            f"Resolved {provider_type} provider: {provider_name}"
-                        )
-                        return provider
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to create {provider_type} provider '{provider_name}': {e}"
+            factory = providers_registry.get(provider_name)
+            if factory is None:
+                continue
+            try:
+                provider = factory(provider_config)
+                if provider is not None:
+                    logger.info(
+                        "Resolved %s provider: %s", provider_type, provider_name
                     )
+                    return provider
+            except Exception as e:
+                logger.warning(
+                    "Failed to create %s provider '%s': %s",
+                    provider_type,
+                    provider_name,
+                    e,
+                )
 
         logger.warning(
-            f"No {provider_type} provider could be resolved from configuration"
+            "No %s provider could be resolved from configuration", provider_type
         )
         return None
 
@@ -1,13 +1,12 @@
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 import threading
 
-from dotenv import load_dotenv
-from dynaconf import Dynaconf
-
+from core.config import TemplateValueCache, ensure_dotenv_loaded
 from core.log import get_logger
 
-load_dotenv()
+if TYPE_CHECKING:
+    from dynaconf import Dynaconf
 
 logger = get_logger("BasePrompts")
 
@@ -17,6 +16,8 @@ class BasePrompts:
 
     _prompts_path: str
     _settings: Any
+    _prompts_data: dict[str, Any]
+    _templates: TemplateValueCache
 
     def __init__(
         self,
@@ -27,6 +28,8 @@ class BasePrompts:
             # Copy constructor: share settings from another BasePrompts instance
             self._prompts_path = base_prompts._prompts_path
             self._settings = base_prompts._settings
+            self._prompts_data = base_prompts._prompts_data
+            self._templates = base_prompts._templates
         else:
             if prompts_path is None:
                 # Default to config/prompts.yaml relative to project root
@@ -35,13 +38,18 @@ class BasePrompts:
 
             self._prompts_path = prompts_path
             self._settings = self._load_prompts()
+            self._prompts_data = self._settings.to_dict()
+            self._templates = TemplateValueCache(self._settings)
 
-    def _load_prompts(self) -> Dynaconf:
+    def _load_prompts(self) -> "Dynaconf":
         """Load and resolve the YAML prompts file using Dynaconf."""
         assert self._prompts_path is not None
         if not Path(self._prompts_path).exists():
             raise FileNotFoundError(f"Prompts file not found: {self._prompts_path}")
 
+        ensure_dotenv_loaded()
+        from dynaconf import Dynaconf
+
         # Use Dynaconf to load prompts with environment variable resolution
         settings = Dynaconf(
             settings_files=[
@@ -69,13 +77,10 @@ class BasePrompts:
         Returns:
             The prompt string or default
         """
-        try:
-            # Dynaconf supports dot notation natively
-            result = self._settings.get(key_path, default)
-            return str(result) if result is not None else default
-        except Exception as e:
-            logger.warning(f"Error Prompt key '{key_path}' not found: {str(e)}")
-            return default
+        # Read from the prompts resolved at load time; templated keys are
+        # rendered again when an environment variable they read changes
+        result = self._templates.lookup(self._prompts_data, key_path)
+        return str(result) if result is not None else default
 
     def with_overlay(self, overlay_path: str) -> "BasePrompts":
         """Create a new prompts instance with overlay merged on top of this one.
@@ -94,6 +99,8 @@ class BasePrompts:
         clone._settings = self._settings.dynaconf_clone()
         if Path(overlay_path).exists():
             clone._settings.load_file(path=overlay_path)
+        clone._prompts_data = clone._settings.to_dict()
+        clone._templates = TemplateValueCache(clone._settings)
         return clone
 
 
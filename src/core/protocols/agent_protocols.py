@@ -1,4 +1,3 @@
-from abc import abstractmethod
 from typing import TYPE_CHECKING, Any, Protocol, Union
 
 from pydantic_ai.usage import RunUsage
@@ -22,7 +21,6 @@ class AgentExecutionContext(Protocol):
     report status, send responses, and access configuration and messages.
     """
 
-    @abstractmethod
     async def send_status(self, message: str) -> None:
         """Report agent execution status to the user.
 
@@ -31,7 +29,6 @@ class AgentExecutionContext(Protocol):
         """
         ...
 
-    @abstractmethod
     async def send_response(self, response: str) -> None:
         """Send final response to the user.
 
@@ -40,7 +37,6 @@ class AgentExecutionContext(Protocol):
         """
         ...
 
-    @abstractmethod
     async def send_attachment(
         self, name: str, content: str | bytes, is_binary: bool = False
     ) -> None:
@@ -56,7 +52,6 @@ class AgentExecutionContext(Protocol):
         """
         ...
 
-    @abstractmethod
     def get_message_list(self) -> MessageList:
         """Get the list of messages available to the agent.
 
@@ -65,7 +60,6 @@ class AgentExecutionContext(Protocol):
         """
         ...
 
-    @abstractmethod
     def get_config(self) -> BaseConfig:
         """Get the configuration object.
 
@@ -74,7 +68,6 @@ class AgentExecutionContext(Protocol):
         """
         ...
 
-    @abstractmethod
     def get_prompts(self) -> BasePrompts:
         """Get the prompts object.
 
@@ -83,7 +76,6 @@ class AgentExecutionContext(Protocol):
         """
         ...
 
-    @abstractmethod
     def get_execution_id(self) -> str:
         """Get the unique execution identifier for this agent context.
 
@@ -234,7 +226,6 @@ class Agent(Protocol):
         """
         ...
 
-    @abstractmethod
     async def run(self) -> Any:
         """Execute the agent."""
         ...
@@ -246,7 +237,6 @@ class AgentFactory(Protocol):
     Defines interface for creating and configuring agents.
     """
 
-    @abstractmethod
     def create_agent(self, agent_type: str) -> type[Agent]:
         """Create an agent class of the specified type.
 
@@ -1,4 +1,5 @@
 from typing import Protocol, runtime_checkable
+import logging
 
 from core.log import get_logger
 from core.message import MessageList
@@ -31,22 +32,29 @@ class DummyMessageConsumer:
         Args:
             messages: MessageList containing messages to process
         """
-        self.logger.info(f"DummyMessageConsumer received {len(messages)} messages")
+        # get_messages() copies the list, so take it once and reuse it
+        message_items = messages.get_messages()
+        self.logger.info(
+            "DummyMessageConsumer received %d messages", len(message_items)
+        )
 
-        if not messages:
+        if not message_items:
             self.logger.info("No messages to process")
             return
 
         # Process messages directly (already filtered to single thread)
-        if messages:
-            first_message = messages.get_messages()[0]
-            thread_id = first_message.get_thread_id()
-            self.logger.info(f"Processing thread: {thread_id}")
+        thread_id = message_items[0].get_thread_id()
+        self.logger.info("Processing thread: %s", thread_id)
 
-            for message in messages:
+        # Skip the per-message getter calls entirely when INFO is disabled
+        if self.logger.isEnabledFor(logging.INFO):
+            for message in message_items:
                 self.logger.info(
-                    f"  Message from {message.get_user_name()} ({message.get_user_id()}) "
-                    f"at {message.get_message_date()}: {message.get_message_content()}"
+                    "  Message from %s (%s) at %s: %s",
+                    message.get_user_name(),
+                    message.get_user_id(),
+                    message.get_message_date(),
+                    message.get_message_content(),
                 )
 
         self.logger.info("DummyMessageConsumer finished processing messages")
@@ -1,4 +1,3 @@
-from abc import abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Optional, Protocol
 
@@ -18,7 +17,7 @@ class PipelineModel:
     coverage: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PullRequestModel:
     """Model representing a pull request from any provider."""
 
@@ -30,7 +29,7 @@ class PullRequestModel:
     target_refs: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IssueModel:
     """Model representing an issue/work item from any provider."""
 
@@ -42,7 +41,6 @@ class PullRequestProvider(Protocol):
     """Protocol for pull request providers (Azure DevOps, GitHub, GitLab, etc.)."""
 
     @staticmethod
-    @abstractmethod
     def from_config(config: dict[str, Any]) -> Optional["PullRequestProvider"]:
         """Create provider instance from configuration.
 
@@ -54,7 +52,6 @@ class PullRequestProvider(Protocol):
         """
         ...
 
-    @abstractmethod
     async def load(self, pull_request_id: str) -> PullRequestModel:
         """Load pull request by ID.
 
@@ -74,7 +71,6 @@ class IssueProvider(Protocol):
     """Protocol for issue providers (Azure DevOps, Jira, GitHub Issues, etc.)."""
 
     @staticmethod
-    @abstractmethod
     def from_config(config: dict[str, Any]) -> Optional["IssueProvider"]:
         """Create provider instance from configuration.
 
@@ -86,7 +82,6 @@ class IssueProvider(Protocol):
         """
         ...
 
-    @abstractmethod
     async def load(self, issue_id: str) -> IssueModel:
         """Load issue/work item by ID.
 
@@ -157,7 +152,6 @@ class PipelineProvider(Protocol):
     """Protocol for CI/CD pipeline providers (GitLab CI, GitHub Actions, etc.)."""
 
     @staticmethod
-    @abstractmethod
     def from_config(config: dict[str, Any]) -> Optional["PipelineProvider"]:
         """Create provider instance from configuration.
 
@@ -169,7 +163,6 @@ class PipelineProvider(Protocol):
         """
         ...
 
-    @abstractmethod
     async def load(self, pipeline_id: str) -> PipelineModel:
         """Load pipeline by ID.
 
@@ -184,7 +177,6 @@ class PipelineProvider(Protocol):
         """
         ...
 
-    @abstractmethod
     async def list(
         self, filters: PipelineListFilter | None = None
     ) -> list[PipelineSummaryModel]:
@@ -201,7 +193,6 @@ class PipelineProvider(Protocol):
         """
         ...
 
-    @abstractmethod
     async def get_job_log(self, pipeline_id: str, job_id: str) -> str:
         """Get log output for a specific job.
 
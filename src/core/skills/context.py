@@ -74,10 +74,12 @@ class SkillContext(Generic[DepsT]):
             return
 
         last_model_response = self._run_ctx.messages[-1]
-        text_part = next(
-            (part for part in last_model_response.parts if part.part_kind == "text"),
-            None,
-        )
+        text_part = None
+        for part in last_model_response.parts:
+            if part.part_kind == "text":
+                text_part = part
+                break
+
         if text_part:
             await self._exec_ctx.send_response(text_part.content)
         elif fallback_message:
@@ -0,0 +1,23 @@
+"""Helpers for interpreting raw configuration values."""
+
+from typing import Any
+
+# Lower-cased string values treated as true for boolean settings
+TRUE_STRINGS = frozenset(("true", "1", "yes", "on"))
+
+
+def parse_bool(value: Any) -> bool:
+    """Interpret a configuration value as a boolean.
+
+    Booleans are returned unchanged; any other value is true only if its
+    lower-cased string form is one of ``TRUE_STRINGS``.
+
+    Args:
+        value: Raw value from configuration (bool, str, int, ...)
+
+    Returns:
+        Parsed boolean value
+    """
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in TRUE_STRINGS
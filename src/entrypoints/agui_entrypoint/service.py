@@ -6,7 +6,6 @@ from typing import Any, cast
 import asyncio
 import os
 import threading
-import traceback
 
 from ag_ui.core import (
     EventType,
@@ -274,9 +273,8 @@ async def run_agent(input_data: RunAgentInput, request: Request) -> StreamingRes
                 )
             )
         except Exception as unexpected_error:
-            error_traceback = traceback.format_exc()
             logger.error(
-                f"Unexpected error in agent run: {str(unexpected_error)}\\n{error_traceback}"
+                "Unexpected error in agent run: %s", unexpected_error, exc_info=True
             )
             yield encoder.encode(
                 RunErrorEvent(
@@ -1,6 +1,8 @@
 """CLI implementation of AgentExecutionContext."""
 
 from datetime import datetime
+import functools
+import secrets
 import sys
 import uuid
 
@@ -14,8 +16,14 @@ from entrypoints.cli_entrypoint.message import CLIMessage
 logger = get_logger("CLIAgentContext")
 
 
+_RED = "\033[31;1m"  # Bold bright red
+_GREEN = "\033[92m"  # Bright green
+_RESET = "\033[0m"
+
+
+@functools.lru_cache(maxsize=1)
 def _supports_color() -> bool:
-    """Check if terminal supports ANSI colors."""
+    """Check if terminal supports ANSI colors (evaluated once per process)."""
     return (
         hasattr(sys.stdout, "isatty")
         and sys.stdout.isatty()
@@ -24,21 +32,26 @@ def _supports_color() -> bool:
     )
 
 
-def _colorize(text: str, color_code: str) -> str:
-    """Add ANSI color codes to text if terminal supports colors."""
+@functools.lru_cache(maxsize=1)
+def _response_affixes() -> tuple[str, str]:
+    """Get the prefix and suffix printed around an assistant response."""
     if _supports_color():
-        return f"\033[{color_code}m{text}\033[0m"
-    return text
+        return f"\n\n{_RED}Assistant: ", f"{_RESET}\n\n\n"
+    return "\n\nAssistant: ", "\n\n\n"
 
 
 def _red(text: str) -> str:
     """Make text red if terminal supports colors."""
-    return _colorize(text, "31;1")  # Bold bright red
+    if not _supports_color():
+        return text
+    return _RED + text + _RESET
 
 
 def _green(text: str) -> str:
     """Make text green if terminal supports colors."""
-    return _colorize(text, "92")  # Bright green
+    if not _supports_color():
+        return text
+    return _GREEN + text + _RESET
 
 
 class CLIAgentContext(AgentExecutionContext):
@@ -60,11 +73,10 @@ class CLIAgentContext(AgentExecutionContext):
         self.config = config
         self.prompts = prompts
         self.thread_id = thread_id
-        self.execution_id = str(uuid.uuid4())
+        # Generated on first use; most CLI runs never ask for it
+        self._execution_id: str | None = None
 
-        logger.info(
-            f"Created CLI agent context: thread_id={thread_id}, execution_id={self.execution_id}"
-        )
+        logger.info("Created CLI agent context: thread_id=%s", thread_id)
 
     async def send_status(self, message: str) -> None:
         """Send agent execution status by printing to console.
@@ -74,8 +86,8 @@ class CLIAgentContext(AgentExecutionContext):
         Args:
             message: Status message to print
         """
-        print(f"🔄 {message}")
-        logger.info(f"Status: {message}")
+        sys.stdout.write("🔄 " + message + "\n")
+        logger.info("Status: %s", message)
 
     async def send_response(self, response: str) -> None:
         """Send final response by printing to console and adding to history.
@@ -86,12 +98,16 @@ class CLIAgentContext(AgentExecutionContext):
         Args:
             response: Final response message
         """
-        print(f"\n\n{_red(f'Assistant: {response}')}\n\n")
-        logger.info(f"Response: {response[:100]}...")
+        prefix, suffix = _response_affixes()
+        write = sys.stdout.write
+        write(prefix)
+        write(response)
+        write(suffix)
+        logger.info("Response: %.100s...", response)
 
         # Add response to message history
         response_message = CLIMessage(
-            message_id=str(uuid.uuid4()),
+            message_id=secrets.token_hex(16),
             role="assistant",
             content=response,
             timestamp=datetime.now(),
@@ -172,7 +188,9 @@ class CLIAgentContext(AgentExecutionContext):
         Returns:
             Unique identifier that can be used for state persistence
         """
-        return self.execution_id
+        if self._execution_id is None:
+            self._execution_id = uuid.uuid4().hex
+        return self._execution_id
 
     def add_user_message(self, content: str) -> None:
         """Add a user message to the conversation history.
@@ -181,7 +199,7 @@ class CLIAgentContext(AgentExecutionContext):
             content: User's message content
         """
         user_message = CLIMessage(
-            message_id=str(uuid.uuid4()),
+            message_id=secrets.token_hex(16),
             role="user",
             content=content,
             timestamp=datetime.now(),
@@ -1,41 +1,46 @@
 """CLI message implementation for command-line interface."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import ClassVar
 
 from core.message import BaseMessage
 
 
-@dataclass
+@dataclass(slots=True)
 class CLIMessage(BaseMessage):
     """Message implementation for CLI interactions.
 
     Simple message structure for command-line user input and agent responses.
+    Sender name and id are derived from the role once at construction.
     """
 
+    # role -> (user_name, user_id); any other role is reported as "System"
+    _ROLE_TABLE: ClassVar[dict[str, tuple[str, str]]] = {
+        "user": ("CLI User", "cli-user"),
+        "assistant": ("Assistant", "assistant"),
+    }
+
     message_id: str
     role: str  # "user" or "assistant"
     content: str
     timestamp: datetime
     thread_id: str = "cli-session"
+    user_name: str = field(init=False, repr=False)
+    user_id: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.user_name, self.user_id = self._ROLE_TABLE.get(
+            self.role, ("System", "system")
+        )
 
     def get_user_name(self) -> str:
         """Get the display name of the message sender."""
-        if self.role == "user":
-            return "CLI User"
-        elif self.role == "assistant":
-            return "Assistant"
-        else:
-            return "System"
+        return self.user_name
 
     def get_user_id(self) -> str:
         """Get the unique identifier of the message sender."""
-        if self.role == "user":
-            return "cli-user"
-        elif self.role == "assistant":
-            return "assistant"
-        else:
-            return "system"
+        return self.user_id
 
     def get_message_content(self) -> str:
         """Get the text content of the message."""
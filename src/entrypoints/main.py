@@ -157,14 +157,18 @@ class ServiceOrchestrator:
 
 def print_release_info() -> None:
     """Print release information if available."""
-    try:
-        with Path("release.txt").open() as f:
-            release_info = f.read().strip()
-            logger.info(f"Release information:\\n{release_info}")
-    except FileNotFoundError:
+    release_file = Path("release.txt")
+    if not release_file.is_file():
         logger.info("No release information available")
-    except Exception as release_error:
-        logger.warning(f"Could not read release information: {release_error}")
+        return
+
+    try:
+        release_info = release_file.read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError) as release_error:
+        logger.warning("Could not read release information: %s", release_error)
+        return
+
+    logger.info("Release information:\n%s", release_info)
 
 
 def setup_verbose_logging(verbose: bool) -> None:
@@ -50,7 +50,11 @@ class SlackAgentContext(AgentExecutionContext):
                 )
 
         logger.info(
-            f"Created Slack agent context: channel={channel_id}, thread={thread_ts}, context_id={self.context_id}, bot_mentioned={self._bot_mentioned}"
+            "Created Slack agent context: channel=%s, thread=%s, context_id=%s, bot_mentioned=%s",
+            channel_id,
+            thread_ts,
+            self.context_id,
+            self._bot_mentioned,
         )
 
     async def _send_or_update_message(
@@ -69,7 +73,7 @@ class SlackAgentContext(AgentExecutionContext):
         try:
             if self.last_message_ts:
                 # Update existing message
-                logger.debug(f"Updating existing message {self.last_message_ts}")
+                logger.debug("Updating existing message %s", self.last_message_ts)
                 message_ts = self.slack_client.update_message(
                     channel_id=self.channel_id,
                     message_ts=self.last_message_ts,
@@ -89,7 +93,7 @@ class SlackAgentContext(AgentExecutionContext):
 
             if message_ts:
                 msg_type = "status" if is_status else "response"
-                logger.info(f"{action} {msg_type} message: {message_ts}")
+                logger.info("%s %s message: %s", action, msg_type, message_ts)
 
                 # Manage last_message_ts based on message type
                 if is_status:
@@ -103,11 +107,16 @@ class SlackAgentContext(AgentExecutionContext):
 
         except Exception as e:
             logger.error(
-                f"Failed to send/update message: {type(e).__name__}: {str(e)}",
+                "Failed to send/update message: %s: %s",
+                type(e).__name__,
+                e,
                 exc_info=True,
             )
             logger.error(
-                f"Context: channel_id={self.channel_id}, thread_ts={self.thread_ts}, last_message_ts={self.last_message_ts}"
+                "Context: channel_id=%s, thread_ts=%s, last_message_ts=%s",
+                self.channel_id,
+                self.thread_ts,
+                self.last_message_ts,
             )
             return None
 
@@ -119,7 +128,7 @@ class SlackAgentContext(AgentExecutionContext):
         Args:
             message: Status message to send
         """
-        logger.info(f"Sending status: {message}")
+        logger.info("Sending status: %s", message)
 
         # Format status message with emoji for better UX
         formatted_message = f"{message}"
@@ -135,7 +144,7 @@ class SlackAgentContext(AgentExecutionContext):
         Args:
             response: Final response message
         """
-        logger.info(f"Sending response: {response[:100]}...")
+        logger.info("Sending response: %s...", response[:100])
 
         # Send or update message - timestamp cleared automatically by shared method
         message_ts = await self._send_or_update_message(response, is_status=False)
@@ -166,7 +175,7 @@ class SlackAgentContext(AgentExecutionContext):
         Raises:
             NotImplementedError: If binary attachments are requested
         """
-        logger.info(f"Posting attachment: {name} (binary: {is_binary})")
+        logger.info("Posting attachment: %s (binary: %s)", name, is_binary)
 
         if is_binary:
             logger.error("Binary attachments not yet supported in Slack")
@@ -189,16 +198,16 @@ class SlackAgentContext(AgentExecutionContext):
 
             if canvas_id:
                 logger.info(
-                    f"Successfully posted attachment '{name}' as canvas: {canvas_id}"
+                    "Successfully posted attachment '%s' as canvas: %s", name, canvas_id
                 )
             else:
                 logger.error(
-                    f"Failed to post attachment '{name}' - canvas creation failed"
+                    "Failed to post attachment '%s' - canvas creation failed", name
                 )
                 raise Exception(f"Failed to create canvas for attachment '{name}'")
 
         except Exception as e:
-            logger.error(f"Error posting attachment '{name}': {str(e)}")
+            logger.error("Error posting attachment '%s': %s", name, e)
             raise Exception(f"Failed to post attachment '{name}': {str(e)}")
 
     def get_message_list(self) -> MessageList:
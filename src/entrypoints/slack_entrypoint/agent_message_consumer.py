@@ -1,5 +1,7 @@
 """Slack message consumer that uses the agent architecture."""
 
+import contextlib
+
 from core.agents.service import AgentService
 from core.config import BaseConfig
 from core.log import get_logger
@@ -39,7 +41,7 @@ class AgentMessageConsumer(MessageConsumer):
             return GitChatbotAgent
 
         self.agent_service.register_agent(AGENT_NAME, create_chatbot_agent)
-        logger.info("Registered agents: " + AGENT_NAME)
+        logger.info("Registered agents: %s", AGENT_NAME)
 
     async def consume(self, messages: MessageList) -> None:
         """Process messages using the agent architecture.
@@ -47,72 +49,58 @@ class AgentMessageConsumer(MessageConsumer):
         Args:
             messages: MessageList containing messages to process
         """
-        logger.info(f"AgentMessageConsumer received {len(messages)} messages")
+        message_items = messages.get_messages()
+        logger.info("AgentMessageConsumer received %d messages", len(message_items))
 
-        if not messages:
+        if not message_items:
             logger.info("No messages to process")
             return
 
-        try:
-            # Process messages directly (already filtered to single thread by service)
-            if messages:
-                first_message = messages.get_messages()[0]
-                # Cast to SlackMessage to access channel_id
-                from entrypoints.slack_entrypoint.slack_bot_service import SlackMessage
-
-                slack_message = first_message
-                if isinstance(slack_message, SlackMessage):
-                    channel_id = slack_message.channel_id
-                else:
-                    raise Exception(
-                        f"Unexpected type {type(slack_message)} in message list"
-                    )
-
-                thread_id = first_message.get_thread_id()
+        # Messages are already filtered to a single thread by the service
+        first_message = message_items[0]
+        # Cast to SlackMessage to access channel_id
+        from entrypoints.slack_entrypoint.slack_bot_service import SlackMessage
 
-                try:
-                    logger.info(
-                        f"Processing thread: {thread_id} with {len(messages)} messages"
-                    )
-
-                    # Create Slack agent context
-                    context = SlackAgentContext(
-                        slack_client=self.slack_client,
-                        channel_id=channel_id,
-                        thread_ts=thread_id,
-                        message_list=messages,  # Use messages directly, already loaded by service
-                        config=self.config,
-                        prompts=get_default_prompts(),
-                    )
+        if not isinstance(first_message, SlackMessage):
+            raise Exception(f"Unexpected type {type(first_message)} in message list")
 
-                    # Import here to avoid circular dependency
-                    from agents.agents.gitchatbot.agent import AGENT_NAME
+        channel_id = first_message.channel_id
+        thread_id = first_message.get_thread_id()
+        context: SlackAgentContext | None = None
 
-                    agent_type = AGENT_NAME
-                    # Execute agent using service - handles creation, execution, monitoring, and error handling
-                    logger.info(f"Executing agent: {agent_type}")
-                    await self.agent_service.execute_agent_by_type(agent_type, context)
+        try:
+            logger.info(
+                "Processing thread: %s with %d messages", thread_id, len(message_items)
+            )
+
+            # Create Slack agent context
+            context = SlackAgentContext(
+                slack_client=self.slack_client,
+                channel_id=channel_id,
+                thread_ts=thread_id,
+                message_list=messages,  # Use messages directly, already loaded by service
+                config=self.config,
+                prompts=get_default_prompts(),
+            )
+
+            # Import here to avoid circular dependency
+            from agents.agents.gitchatbot.agent import AGENT_NAME
+
+            agent_type = AGENT_NAME
+            # Execute agent using service - handles creation, execution, monitoring, and error handling
+            logger.info("Executing agent: %s", agent_type)
+            await self.agent_service.execute_agent_by_type(agent_type, context)
+
+            logger.info("Agent execution completed: %s - %s", agent_type, thread_id)
 
-                    logger.info(
-                        f"Agent execution completed: {agent_type} - {thread_id}"
-                    )
+        except Exception as e:
+            logger.error("Error processing thread %s: %s", thread_id, e, exc_info=True)
 
-                except Exception as e:
-                    logger.error(
-                        f"Error processing thread {thread_id}: {str(e)}", exc_info=True
+            # Try to send error message to Slack if we have context (best effort)
+            if context is not None:
+                with contextlib.suppress(Exception):
+                    await context.send_response(
+                        f"❌ Sorry, I encountered an error: {str(e)}"
                     )
 
-                    # Try to send error message to Slack if we have context
-                    try:
-                        if "context" in locals():
-                            await context.send_response(
-                                f"❌ Sorry, I encountered an error: {str(e)}"
-                            )
-                    except Exception:
-                        pass  # Best effort  # nosec B110
-
-                    raise
-
-        except Exception as e:
-            logger.error(f"Error in AgentMessageConsumer: {str(e)}")
             raise
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 import os
 import threading
-import traceback
 
 from dotenv import load_dotenv
 
@@ -41,7 +40,7 @@ def main() -> None:
         logger.info("Slack configuration validated")
 
     except Exception as e:
-        logger.error(f"Error loading configuration: {str(e)}")
+        logger.error("Error loading configuration: %s", e)
         return
 
     # Initialize Slack client for the agent consumer
@@ -65,8 +64,7 @@ def main() -> None:
     except KeyboardInterrupt:
         logger.info("Received interrupt signal, shutting down...")
     except Exception as e:
-        error_traceback = traceback.format_exc()
-        logger.error(f"Error in main loop: {str(e)}\n{error_traceback}")
+        logger.error("Error in main loop: %s", e, exc_info=True)
     finally:
         logger.info("Slack Bot shutting down")
 
@@ -94,7 +92,7 @@ def start_service(shutdown_event: threading.Event) -> None:
         logger.info("Slack configuration validated")
 
     except Exception as e:
-        logger.error(f"Error loading configuration: {str(e)}")
+        logger.error("Error loading configuration: %s", e)
         return
 
     # Initialize Slack client for the agent consumer
@@ -125,8 +123,7 @@ def start_service(shutdown_event: threading.Event) -> None:
     try:
         bot_service.start()  # Blocks until internal shutdown_event is set
     except Exception as e:
-        error_traceback = traceback.format_exc()
-        logger.error(f"Error in Slack bot: {str(e)}\n{error_traceback}")
+        logger.error("Error in Slack bot: %s", e, exc_info=True)
     finally:
         logger.info("Slack Bot shutting down")
 
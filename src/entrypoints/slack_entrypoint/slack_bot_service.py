@@ -123,9 +123,12 @@ class SlackBotService:
             self.shutdown_event.wait()  # Block until shutdown
             self.logger.info("Shutdown event received, stopping service...")
         except Exception as e:
-            self.logger.error(f"Error in service: {str(e)}")
+            self.logger.error("Error in service: %s", e)
             raise
         finally:
+            # Stop receiving new events before draining the asyncio thread
+            self.slack_service.stop_socket_client()
+
             # Signal asyncio thread to shutdown
             if (
                 self.asyncio_loop
@@ -150,16 +153,16 @@ class SlackBotService:
             thread_ts = raw_message.get(
                 "thread_ts", raw_message.get("messageId", "unknown")
             )
-            self.logger.debug(f"Raw message queued for processing: {thread_ts}")
+            self.logger.debug("Raw message queued for processing: %s", thread_ts)
 
         except Exception as e:
-            self.logger.error(f"Error handling new message: {str(e)}")
+            self.logger.error("Error handling new message: %s", e)
 
     def _setup_signal_handlers(self) -> None:
         """Set up signal handlers for graceful shutdown."""
 
         def signal_handler(signum: int, _frame: Any) -> None:
-            self.logger.info(f"Received signal {signum}, initiating shutdown...")
+            self.logger.info("Received signal %s, initiating shutdown...", signum)
             # Signal shutdown using threading.Event (thread-safe)
             self.shutdown_event.set()
 
@@ -185,7 +188,7 @@ class SlackBotService:
             self.logger.info("Asyncio message processing thread started")
             self.asyncio_loop.run_until_complete(self._message_queue_processor())
         except Exception as e:
-            self.logger.error(f"Error in asyncio thread: {str(e)}")
+            self.logger.error("Error in asyncio thread: %s", e)
         finally:
             self.asyncio_loop.close()
             self.logger.info("Asyncio message processing thread stopped")
@@ -239,7 +242,10 @@ class SlackBotService:
                         content_preview = content[:100]
 
                         self.logger.debug(
-                            f"Raw message: {username}: {content_preview} (thread: {thread_id})"
+                            "Raw message: %s: %s (thread: %s)",
+                            username,
+                            content_preview,
+                            thread_id,
                         )
 
                         # Check if this is a top-level message (not a thread response)
@@ -247,8 +253,9 @@ class SlackBotService:
                             # Top-level message: only process if bot is explicitly mentioned
                             if self.slack_service.is_bot_mentioned(content):
                                 self.logger.info(
-                                    f"Bot mentioned in top-level message from {username}, "
-                                    f"registering thread {thread_id}"
+                                    "Bot mentioned in top-level message from %s, registering thread %s",
+                                    username,
+                                    thread_id,
                                 )
                                 self.slack_service.register_bot_conversation(
                                     thread_id, sender_id
@@ -256,7 +263,8 @@ class SlackBotService:
                                 unique_threads.add((channel_id, thread_id))
                             else:
                                 self.logger.debug(
-                                    f"Bot not mentioned in top-level message from {username}, skipping"
+                                    "Bot not mentioned in top-level message from %s, skipping",
+                                    username,
                                 )
                         else:
                             # Thread reply: use participant-based filtering
@@ -289,12 +297,14 @@ class SlackBotService:
                         unique_threads.discard((channel_id, thread_id))
 
                     self.logger.info(
-                        f"Processing {len(raw_messages)} raw messages into {len(unique_threads)} unique threads"
+                        "Processing %s raw messages into %s unique threads",
+                        len(raw_messages),
+                        len(unique_threads),
                     )
 
                     # Process each unique thread
                     for channel_id, thread_id in unique_threads:
-                        self.logger.info(f"Starting task for thread_id={thread_id}")
+                        self.logger.info("Starting task for thread_id=%s", thread_id)
                         preloaded = preloaded_conversations.get((channel_id, thread_id))
                         self.task_manager.start_task(
                             thread_id,
@@ -302,7 +312,7 @@ class SlackBotService:
                         )
 
             except Exception as e:
-                self.logger.error(f"Error in message queue processor: {str(e)}")
+                self.logger.error("Error in message queue processor: %s", e)
                 await asyncio.sleep(1)  # Wait before retrying
 
     async def _process_messages(
@@ -325,7 +335,7 @@ class SlackBotService:
                     # Check if thread is already being processed
                     if thread_id in self.active_threads:
                         self.logger.info(
-                            f"Thread {thread_id} is already being processed, skipping"
+                            "Thread %s is already being processed, skipping", thread_id
                         )
                         return
 
@@ -342,12 +352,14 @@ class SlackBotService:
                         # Use preloaded conversation if available, otherwise fetch
                         if preloaded_conversation is not None:
                             self.logger.debug(
-                                f"Using preloaded conversation for thread {thread_id}"
+                                "Using preloaded conversation for thread %s", thread_id
                             )
                             slack_messages = preloaded_conversation
                         else:
                             self.logger.info(
-                                f"Loading conversation for thread {thread_id} in channel {channel_id}"
+                                "Loading conversation for thread %s in channel %s",
+                                thread_id,
+                                channel_id,
                             )
                             slack_messages = self.slack_service.get_thread_conversation(
                                 channel_id, thread_id
@@ -361,7 +373,9 @@ class SlackBotService:
                                     channel_id, last_message_ts, "eyes"
                                 )
 
-                        # Convert to SlackMessage objects using existing method
+                        # Resolve all participant names up front, then convert
+                        # to SlackMessage objects using existing method
+                        self.slack_service.prefetch_user_names(slack_messages)
                         processed_messages = [
                             self.slack_service.create_slack_message_from_api(
                                 msg, channel_id
@@ -372,17 +386,19 @@ class SlackBotService:
                         # Create MessageList and call consumer
                         message_list = MessageList(processed_messages)
                         self.logger.info(
-                            f"Processing thread {thread_id} with {len(message_list)} messages"
+                            "Processing thread %s with %s messages",
+                            thread_id,
+                            len(message_list),
                         )
 
                         # Consume messages
                         await self.consumer.consume(message_list)
 
-                        self.logger.info(f"Successfully processed thread {thread_id}")
+                        self.logger.info("Successfully processed thread %s", thread_id)
 
                     except Exception as e:
                         self.logger.error(
-                            f"Error processing thread {thread_id}: {str(e)}"
+                            "Error processing thread %s: %s", thread_id, e
                         )
 
                     finally:
@@ -397,15 +413,15 @@ class SlackBotService:
 
         except TimeoutError:
             self.logger.error(
-                f"Thread {thread_id} processing timed out after {self.processing_timeout}s"
+                "Thread %s processing timed out after %ss",
+                thread_id,
+                self.processing_timeout,
             )
             self.active_threads.discard(thread_id)
         except asyncio.CancelledError:
-            self.logger.info(f"Thread {thread_id} processing cancelled")
+            self.logger.info("Thread %s processing cancelled", thread_id)
             self.active_threads.discard(thread_id)
             # Response is sent by stop_handler, task cleanup by task_manager
         except Exception as e:
-            self.logger.error(
-                f"Unexpected error processing thread {thread_id}: {str(e)}"
-            )
+            self.logger.error("Unexpected error processing thread %s: %s", thread_id, e)
             self.active_threads.discard(thread_id)
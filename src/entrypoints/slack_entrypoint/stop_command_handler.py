@@ -55,6 +55,6 @@ class StopCommandHandler:
             self.slack_service.send_reply(
                 channel_id, thread_id, "Ok, processing stopped."
             )
-            self._logger.info(f"Stopped processing for thread {thread_id}")
+            self._logger.info("Stopped processing for thread %s", thread_id)
             return True
         return False
@@ -46,17 +46,18 @@ class ThreadTaskManager:
         """
         task = self._tasks.get(thread_id)
         if task and not task.done():
-            self._logger.info(f"Cancelling task for thread {thread_id}")
+            self._logger.info("Cancelling task for thread %s", thread_id)
             task.cancel()
             return True
         elif task and task.done():
             self._logger.info(
-                f"Task for thread {thread_id} already done, cannot cancel"
+                "Task for thread %s already done, cannot cancel", thread_id
             )
         else:
             self._logger.warning(
-                f"No task found for thread {thread_id}, "
-                f"active tasks: {list(self._tasks.keys())}"
+                "No task found for thread %s, active tasks: %s",
+                thread_id,
+                list(self._tasks.keys()),
             )
         return False
 
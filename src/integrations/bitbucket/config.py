@@ -1,5 +1,7 @@
 from typing import Any
 
+from core.utils.config_utils import parse_bool
+
 
 class BitBucketConfig:
     """BitBucket specific configuration class that works with project config subsets."""
@@ -13,6 +15,7 @@ class BitBucketConfig:
             config_data: BitBucket configuration dictionary
         """
         self._config_data = config_data or {}
+        self._use_mocks = parse_bool(self._config_data.get("mock", False))
 
     def get_api_url(self) -> str:
         """Get the BitBucket API URL.
@@ -43,21 +46,17 @@ class BitBucketConfig:
 
     def get_use_mocks(self) -> bool:
         """Get the BitBucket mock mode setting."""
-        mock_value = self._config_data.get("mock", "false")
-        # Handle both boolean and string representations
-        if isinstance(mock_value, bool):
-            return mock_value
-        return str(mock_value).lower() in ("true", "1", "yes", "on")
+        return self._use_mocks
 
     def is_configured(self) -> bool:
         """Check if all required BitBucket configuration is present."""
         if self.get_use_mocks():
             return True
 
-        required_fields = [
-            self.get_workspace(),
-            self.get_repo_slug(),
-            self.get_username(),
-            self.get_token(),
-        ]
-        return all(field is not None and field != "" for field in required_fields)
+        required_getters = (
+            self.get_workspace,
+            self.get_repo_slug,
+            self.get_username,
+            self.get_token,
+        )
+        return all(getter() not in (None, "") for getter in required_getters)
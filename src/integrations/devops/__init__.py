@@ -1,14 +1,43 @@
+from typing import TYPE_CHECKING, Any
+
 from core.integrations import get_provider_registry
+from core.protocols.provider_protocols import IssueProvider, PullRequestProvider
 
 from .config import AzureDevOpsConfig
-from .provider import AzureDevOpsIssueProvider, AzureDevOpsPullRequestProvider
+
+if TYPE_CHECKING:
+    from .provider import AzureDevOpsIssueProvider, AzureDevOpsPullRequestProvider
+
+
+# The provider module (httpx, BeautifulSoup models, mocks) is imported on first
+# use rather than when the package is registered.
+def _pullrequest_provider_from_config(
+    config_data: dict[str, Any],
+) -> PullRequestProvider | None:
+    from .provider import AzureDevOpsPullRequestProvider
+
+    return AzureDevOpsPullRequestProvider.from_config(config_data)
+
+
+def _issue_provider_from_config(config_data: dict[str, Any]) -> IssueProvider | None:
+    from .provider import AzureDevOpsIssueProvider
+
+    return AzureDevOpsIssueProvider.from_config(config_data)
+
 
 # Register Azure DevOps providers with the global registry
 registry = get_provider_registry()
-registry.register_pullrequest_provider(
-    "devops", AzureDevOpsPullRequestProvider.from_config
-)
-registry.register_issue_provider("devops", AzureDevOpsIssueProvider.from_config)
+registry.register_pullrequest_provider("devops", _pullrequest_provider_from_config)
+registry.register_issue_provider("devops", _issue_provider_from_config)
+
+
+def __getattr__(name: str) -> Any:
+    if name in ("AzureDevOpsPullRequestProvider", "AzureDevOpsIssueProvider"):
+        from . import provider
+
+        return getattr(provider, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "AzureDevOpsPullRequestProvider",
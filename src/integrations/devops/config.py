@@ -1,5 +1,7 @@
 from typing import Any
 
+from core.utils.config_utils import parse_bool
+
 
 class AzureDevOpsConfig:
     """Azure DevOps specific configuration class that works with project config subsets."""
@@ -11,6 +13,7 @@ class AzureDevOpsConfig:
             config_data: Azure DevOps configuration dictionary
         """
         self._config_data = config_data or {}
+        self._use_mocks = parse_bool(self._config_data.get("mock", False))
 
     def get_url(self) -> str | None:
         """Get the Azure DevOps URL."""
@@ -34,11 +37,7 @@ class AzureDevOpsConfig:
 
     def get_use_mocks(self) -> bool:
         """Get the Azure DevOps mock mode setting."""
-        mock_value = self._config_data.get("mock", "false")
-        # Handle both boolean and string representations
-        if isinstance(mock_value, bool):
-            return mock_value
-        return str(mock_value).lower() in ("true", "1", "yes", "on")
+        return self._use_mocks
 
     def is_configured(self) -> bool:
         """Check if all required Azure DevOps configuration is present."""
@@ -46,11 +45,11 @@ class AzureDevOpsConfig:
         if self.get_use_mocks():
             return True
 
-        required_fields = [
-            self.get_url(),
-            self.get_organization(),
-            self.get_project(),
-            self.get_pat(),
-            self.get_repo_id(),
-        ]
-        return all(field is not None and field != "" for field in required_fields)
+        required_getters = (
+            self.get_url,
+            self.get_organization,
+            self.get_project,
+            self.get_pat,
+            self.get_repo_id,
+        )
+        return all(getter() not in (None, "") for getter in required_getters)
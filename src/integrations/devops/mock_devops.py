@@ -1,5 +1,6 @@
 from pathlib import Path
 from typing import Any
+import functools
 import json
 
 from core.log import get_logger
@@ -7,16 +8,22 @@ from integrations.devops.models import PullRequest, WorkItem
 
 logger = get_logger(logger_name="MockDevOps", level="INFO")
 
+_MOCKS_DIR = Path(__file__).parent / "mocks"
 
+
+@functools.cache
 def get_mock_data(filename: str) -> dict[str, Any]:
-    """Load mock data from a JSON file"""
+    """Load mock data from a JSON file.
+
+    Each fixture is parsed once per process; callers share the returned dict
+    and must not mutate it.
+    """
     try:
-        mock_path = Path(__file__).parent / "mocks" / filename
-        with mock_path.open() as file:
+        with (_MOCKS_DIR / filename).open() as file:
             data = json.load(file)
             return data if isinstance(data, dict) else {}
     except Exception as e:
-        logger.error(f"Error loading mock data from {filename}: {str(e)}")
+        logger.error("Error loading mock data from %s: %s", filename, e)
         return {}
 
 
@@ -28,7 +35,7 @@ def mock_get_pull_request_ids(_self: Any) -> list[str]:
 def mock_fetch_work_item(work_item_id: int) -> WorkItem:
     """Mock implementation of fetch_work_item"""
 
-    logger.info(f"Using mock data for work item {work_item_id}")
+    logger.info("Using mock data for work item %s", work_item_id)
 
     if work_item_id == 111:
         raise ValueError("Mock: Work item 111 not found.")
@@ -41,7 +48,7 @@ def mock_fetch_work_item(work_item_id: int) -> WorkItem:
 def mock_fetch_pull_request(pull_request_id: int) -> PullRequest:
     """Mock implementation of fetch_pull_request"""
 
-    logger.info(f"Using mock data for pull request {pull_request_id}")
+    logger.info("Using mock data for pull request %s", pull_request_id)
     pr_data = get_mock_data("devops_pr.json")
     pr = PullRequest(pr_data, [])  # Empty list for commits
 
@@ -1,38 +1,21 @@
-from typing import Any
+from dataclasses import dataclass
+from functools import cached_property
 
-from pydantic import BaseModel, Field, field_validator
 
-
-class ChangedFile(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ChangedFile:
     """A single file changed in a feature branch."""
 
-    path: str = Field(
-        ..., description="Repository‑relative path of the file (new path for renames)"
-    )
-    status: str = Field(
-        ..., description="Single‑letter git status: A/M/D/R/C/T/B (binary)"
-    )
-    insertions: int | None = Field(
-        None, description="Number of added lines – None for non‑text diffs"
-    )
-    deletions: int | None = Field(
-        None, description="Number of deleted lines – None for non‑text diffs"
-    )
-    binary: bool = Field(False, description="True if file is binary in this diff")
-    patch: str | None = Field(
-        None, description="Full git diff patch text; heavy – populate only on demand"
-    )
-
-    @field_validator("binary", mode="before")
-    @classmethod
-    def _auto_binary(cls, v: bool, info: Any) -> bool:
-        if v is not None:
-            return v
-        values = info.data
-        return values.get("insertions") == "-"
-
-
-class ChangedFileSet(BaseModel):
+    path: str  # Repository‑relative path of the file (new path for renames)
+    status: str  # Single‑letter git status: A/M/D/R/C/T/B (binary)
+    insertions: int | None = None  # Added lines – None for non‑text diffs
+    deletions: int | None = None  # Deleted lines – None for non‑text diffs
+    binary: bool = False  # True if file is binary in this diff
+    patch: str | None = None  # Full git diff patch text; populate only on demand
+
+
+@dataclass
+class ChangedFileSet:
     """All changes unique to *source* since its divergence from *target*."""
 
     source_branch: str
@@ -41,21 +24,43 @@ class ChangedFileSet(BaseModel):
 
     def paths(self) -> list[str]:
         """Shortcut: return just the changed paths."""
-        return [f.path for f in self.files]
+        return self._paths
 
     def get_file_diffs(self) -> dict[str, str]:
         """Get file-by-file diff content for all changed files.
 
+        Built on first call and reused afterwards; ``files`` is not expected to
+        change once the set has been created.
+
         Returns:
             Dictionary mapping file paths to their diff content (patch text)
         """
-        file_diffs = {}
-        for file in self.files:
-            if file.patch is not None:
-                file_diffs[file.path] = file.patch
-            else:
-                # If patch is None, provide a placeholder indicating no patch data
-                file_diffs[file.path] = (
-                    f"# No patch data available for {file.path}\n# Status: {file.status}"
-                )
-        return file_diffs
+        return self._file_diffs
+
+    def line_totals(self) -> tuple[int, int]:
+        """Return total *(insertions, deletions)* over all text files."""
+        return self._line_totals
+
+    @cached_property
+    def _paths(self) -> list[str]:
+        return [f.path for f in self.files]
+
+    @cached_property
+    def _line_totals(self) -> tuple[int, int]:
+        insertions = deletions = 0
+        for f in self.files:
+            insertions += f.insertions or 0
+            deletions += f.deletions or 0
+        return insertions, deletions
+
+    @cached_property
+    def _file_diffs(self) -> dict[str, str]:
+        # If patch is None, provide a placeholder indicating no patch data
+        return {
+            f.path: (
+                f.patch
+                if f.patch is not None
+                else f"# No patch data available for {f.path}\n# Status: {f.status}"
+            )
+            for f in self.files
+        }
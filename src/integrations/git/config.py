@@ -1,7 +1,9 @@
+from functools import cached_property
 from pathlib import Path
 from typing import Any, cast
 
 from core.project_config import ProjectConfig
+from core.utils.config_utils import parse_bool
 
 
 class GitRepositoryConfig:
@@ -14,6 +16,7 @@ class GitRepositoryConfig:
             config_data: Git configuration dictionary
         """
         self._config_data = config_data or {}
+        self._auto_pull = parse_bool(self._config_data.get("autoPull", False))
 
     @classmethod
     def from_project_config(
@@ -30,6 +33,16 @@ class GitRepositoryConfig:
         config_data = project_config.get_git_config()
         return cls(config_data)
 
+    @cached_property
+    def _repo_dir(self) -> str:
+        repo_path = self._config_data.get("path")
+
+        if repo_path:
+            return str(Path(repo_path).resolve())
+
+        # Fallback to current directory
+        return str(Path().resolve())
+
     def get_repo_dir(self) -> str:
         """Get the git repository directory path.
 
@@ -37,16 +50,12 @@ class GitRepositoryConfig:
         1. Configuration file setting (path)
         2. Current working directory (fallback)
 
+        The path is resolved on first call and reused afterwards.
+
         Returns:
             Absolute path to the git repository
         """
-        repo_path = self._config_data.get("path")
-
-        if repo_path:
-            return str(Path(repo_path).resolve())
-
-        # Fallback to current directory
-        return str(Path().resolve())
+        return self._repo_dir
 
     def get_default_branch(self) -> str:
         """Get the default branch name (default: 'main')."""
@@ -54,10 +63,7 @@ class GitRepositoryConfig:
 
     def get_auto_pull(self) -> bool:
         """Get auto-pull setting for repository updates."""
-        auto_pull = self._config_data.get("autoPull", "false")
-        if isinstance(auto_pull, bool):
-            return auto_pull
-        return str(auto_pull).lower() in ("true", "1", "yes", "on")
+        return self._auto_pull
 
     def get_pull_interval_seconds(self) -> int:
         """Get the pull interval in seconds to prevent excessive pulls.
@@ -74,5 +80,4 @@ class GitRepositoryConfig:
         Returns:
             True if repo path exists and is a valid directory
         """
-        repo_path = Path(self.get_repo_dir())
-        return repo_path.exists() and repo_path.is_dir()
+        return Path(self._repo_dir).is_dir()
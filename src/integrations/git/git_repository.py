@@ -1,5 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
+import contextvars
+import re
 import subprocess
 import threading
 import time
@@ -14,9 +18,14 @@ logger = get_logger(logger_name="GitRepository", level="DEBUG")
 
 EMPTY_TREE_HASH = "4b825dc642cb6eb9a060e54bf8d69288fbee4904"
 
+_DIFF_HEADER_RE = re.compile(r"^(?=diff --git )", re.MULTILINE)
+_OBJECT_ID_RE = re.compile(r"[0-9a-f]{40}(?:[0-9a-f]{24})?")
+
 # Global tracking for per-repository pull rate limiting
 _last_pull_times: dict[str, float] = {}
 _pull_locks: dict[str, threading.Lock] = {}
+# Guards creation of the per-repository locks above
+_pull_locks_guard = threading.Lock()
 
 
 class GitRepository:
@@ -31,7 +40,9 @@ class GitRepository:
 
         # Use GitRepositoryConfig to get repository path
         git_config = GitRepositoryConfig.from_project_config(self.project_config)
-        self.repo_path = Path(git_config.get_repo_dir()).resolve()
+        self.repo_path = Path(git_config.get_repo_dir())
+        # branch -> resolved ref (None if not found); cleared on pull()
+        self._ref_cache: dict[str, str | None] = {}
 
         # Auto-pull with rate limiting if enabled
         self._auto_pull_if_needed(git_config)
@@ -63,8 +74,7 @@ class GitRepository:
 
         # Calculate metadata
         total_files = len(changed_files.files)
-        total_insertions = sum(f.insertions or 0 for f in changed_files.files)
-        total_deletions = sum(f.deletions or 0 for f in changed_files.files)
+        total_insertions, total_deletions = changed_files.line_totals()
 
         metadata = DiffMetadata(
             total_files_changed=total_files,
@@ -108,19 +118,36 @@ class GitRepository:
         )
 
         # Use the three dots syntax for git diff (shows changes between branches excluding common ancestors)
-        name_status = self._parse_name_status_three_dots(tgt_ref, src_ref)
-        numstat = self._parse_numstat_three_dots(tgt_ref, src_ref)
+        if include_patch:
+            # One combined diff for all patches instead of a git process per file.
+            # It is independent of the status/numstat diff, so it runs alongside it
+            # in a copy of the current context (keeps the log context token).
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                patches_future = pool.submit(
+                    contextvars.copy_context().run,
+                    self._parse_patches_three_dots,
+                    tgt_ref,
+                    src_ref,
+                )
+                name_status, numstat = self._parse_three_dots(tgt_ref, src_ref)
+                patches = patches_future.result()
+        else:
+            name_status, numstat = self._parse_three_dots(tgt_ref, src_ref)
+            patches = {}
 
         logger.debug("Parsed name_status and numstat: %s, %s", name_status, numstat)
 
         files: list[ChangedFile] = []
         for path, status in name_status.items():
             insertions, deletions, binary_flag = numstat.get(path, (None, None, False))
-            patch = (
-                self._git_output(["git", "diff", f"{tgt_ref}...{src_ref}", "--", path])
-                if include_patch and not binary_flag
-                else None
-            )
+            patch = None
+            if include_patch and not binary_flag:
+                patch = patches.get(path)
+                if patch is None:
+                    # Header could not be matched to the path; diff it on its own
+                    patch = self._git_output(
+                        ["git", "diff", f"{tgt_ref}...{src_ref}", "--", path]
+                    )
             files.append(
                 ChangedFile(
                     path=path,
@@ -135,7 +162,8 @@ class GitRepository:
         return ChangedFileSet(
             source_branch=source_branch,
             target_branch=target_branch,
-            files=sorted(files, key=lambda f: f.path),
+            # git already emits paths in order, so this is a near-linear pass
+            files=sorted(files, key=attrgetter("path")),
         )
 
     def _auto_pull_if_needed(self, git_config: GitRepositoryConfig) -> None:
@@ -153,12 +181,13 @@ class GitRepository:
         pull_interval = git_config.get_pull_interval_seconds()
         current_time = time.time()
 
-        # Get or create lock for this repository path
-        if repo_path_str not in _pull_locks:
-            _pull_locks[repo_path_str] = threading.Lock()
+        # Get or create lock for this repository path; under the guard so two
+        # threads cannot end up with different locks for the same repository
+        with _pull_locks_guard:
+            pull_lock = _pull_locks.setdefault(repo_path_str, threading.Lock())
 
         # Use lock to prevent concurrent pulls for the same repository
-        with _pull_locks[repo_path_str]:
+        with pull_lock:
             last_pull_time = _last_pull_times.get(repo_path_str, 0)
 
             # Check if enough time has passed since last pull
@@ -179,18 +208,24 @@ class GitRepository:
 
     # --------------------- low‑level helpers ------------------------------
 
-    def _git_output(self, cmd: list[str]) -> str:
-        """Run *cmd* in the repo and return **stdout** as *str* (strip tail newline)."""
+    def _git_output(self, cmd: list[str], stdin: str | None = None) -> str:
+        """Run *cmd* in the repo and return **stdout** as *str* (strip tail newline).
+
+        If *stdin* is given it is written to the command's standard input.
+        """
         logger.debug("Running git command: %s", cmd)
-        return (
-            subprocess.check_output(cmd, cwd=self.repo_path)
-            .decode("utf-8", errors="replace")
-            .strip()
-        )
+        if stdin is None:
+            output = subprocess.check_output(cmd, cwd=self.repo_path)
+        else:
+            output = subprocess.check_output(
+                cmd, cwd=self.repo_path, input=stdin.encode("utf-8")
+            )
+        return output.decode("utf-8", errors="replace").strip()
 
     def pull(self) -> str:
         """Execute git pull in the repository to update it with remote changes."""
         logger.debug("Pulling latest changes from remote")
+        self._ref_cache.clear()
         return self._git_output(["git", "pull"])
 
     def get_latest_tags(self, limit: int = 20) -> list[str]:
@@ -319,13 +354,37 @@ class GitRepository:
     # ------------------------------------------------------------------
 
     def _resolve_branch_safe(self, branch: str) -> str | None:
-        """Return the first valid reference for *branch*, or None if not found."""
-        for candidate in (branch, f"origin/{branch}", f"remotes/origin/{branch}"):
-            try:
-                self._git_output(["git", "rev-parse", "--verify", candidate])
+        """Return the first valid reference for *branch*, or None if not found.
+
+        Results are cached per instance until the next pull().
+        """
+        if branch not in self._ref_cache:
+            self._ref_cache[branch] = self._first_existing_ref(
+                _branch_candidates(branch)
+            )
+        return self._ref_cache[branch]
+
+    def _first_existing_ref(self, candidates: list[str]) -> str | None:
+        """Return the first of *candidates* that names an object, or None.
+
+        All candidates are checked with a single ``git cat-file --batch-check``
+        process instead of one ``git rev-parse --verify`` per candidate.
+        """
+        # One name per input line; a name containing a newline cannot be valid
+        candidates = [c for c in candidates if "\n" not in c]
+        if not candidates:
+            return None
+        try:
+            output = self._git_output(
+                ["git", "cat-file", "--batch-check=%(objectname)"],
+                stdin="".join(f"{c}\n" for c in candidates),
+            )
+        except subprocess.CalledProcessError:
+            return None
+        # Found objects print their id; unknown names print "<name> missing"
+        for candidate, line in zip(candidates, output.split("\n"), strict=False):
+            if _OBJECT_ID_RE.fullmatch(line):
                 return candidate
-            except subprocess.CalledProcessError:
-                continue
         return None
 
     def _resolve_branch(self, branch: str) -> str:
@@ -337,11 +396,9 @@ class GitRepository:
 
     def resolve_refs_to_branch(self, refs: list[str]) -> str | None:
         """Resolve first valid reference from a list of refs (branches/commits)."""
-        for ref in refs:
-            resolved = self._resolve_branch_safe(ref)
-            if resolved:
-                return resolved
-        return None
+        return self._first_existing_ref(
+            [candidate for ref in refs for candidate in _branch_candidates(ref)]
+        )
 
     # ------------------------------------------------------------------
 
@@ -353,41 +410,119 @@ class GitRepository:
 
     # ------------------------------------------------------------------
 
-    def _parse_name_status_three_dots(self, tgt: str, src: str) -> dict[str, str]:
-        """Return mapping *path -> status letter* using a three dots git diff."""
+    def _parse_three_dots(
+        self, tgt: str, src: str
+    ) -> tuple[dict[str, str], dict[str, tuple[int | None, int | None, bool]]]:
+        """Return status and line counts per path from one three dots git diff.
+
+        Runs ``git diff --raw --numstat -z`` once and returns two mappings:
+        *path -> status letter* and *path -> (insertions, deletions, binary)*.
+        Renames and copies are keyed by their new path. With ``-z`` paths are
+        emitted verbatim (no C-quoting) and NUL-separated.
+        """
         output = self._git_output(
-            ["git", "diff", "--name-status", "-M", "-C", f"{tgt}...{src}"]
+            ["git", "diff", "--raw", "--numstat", "-M", "-C", "-z", f"{tgt}...{src}"]
         )
-        logger.debug("Got name_status output: %s", output)
-        mapping: dict[str, str] = {}
-        for line in output.splitlines():
-            if not line.strip():
-                continue
-            parts = line.split("\t")
-            status = parts[0]
-            if status.startswith("R") or status.startswith("C"):
-                # Rename/copy: status is like 'R100' – take the new path (last column)
-                path = parts[-1]
-                mapping[path] = status[0]
+        logger.debug("Got raw/numstat output: %r", output)
+        status_map: dict[str, str] = {}
+        numstat: dict[str, tuple[int | None, int | None, bool]] = {}
+        fields = output.split("\0")
+        i = 0
+        while i < len(fields):
+            record = fields[i]
+            if record.startswith(":"):
+                # :<mode> <mode> <sha> <sha> <status> NUL <path> [NUL <new path>]
+                status = record.split(" ")[4]
+                if status.startswith("R") or status.startswith("C"):
+                    # Rename/copy: status is like 'R100' – take the new path
+                    status_map[fields[i + 2]] = status[0]
+                    i += 3
+                else:
+                    status_map[fields[i + 1]] = status
+                    i += 2
+            elif record:
+                # <ins> TAB <dels> TAB <path>, or an empty path followed by
+                # NUL <old path> NUL <new path> for renames/copies
+                ins, dels, path = record.split("\t", 2)
+                if path:
+                    i += 1
+                else:
+                    path = fields[i + 2]
+                    i += 3
+                binary_flag = ins == "-" or dels == "-"
+                insertions = None if binary_flag else int(ins)
+                deletions = None if binary_flag else int(dels)
+                numstat[path] = (insertions, deletions, binary_flag)
             else:
-                path = parts[1]
-                mapping[path] = status
-        return mapping
+                i += 1
+        return status_map, numstat
 
-    def _parse_numstat_three_dots(
-        self, tgt: str, src: str
-    ) -> dict[str, tuple[int | None, int | None, bool]]:
-        """Return mapping *path -> (insertions, deletions, binary)* using three dots git diff."""
+    def _parse_patches_three_dots(self, tgt: str, src: str) -> dict[str, str]:
+        """Return mapping *path -> patch text* from a single three dots git diff.
+
+        Rename detection is disabled so that every path gets its own patch, exactly
+        as a per-path ``git diff tgt...src -- path`` would produce it.
+        """
         output = self._git_output(
-            ["git", "diff", "--numstat", "-M", "-C", f"{tgt}...{src}"]
+            [
+                "git",
+                "diff",
+                "--no-renames",
+                "--src-prefix=a/",
+                "--dst-prefix=b/",
+                f"{tgt}...{src}",
+            ]
         )
-        result: dict[str, tuple[int | None, int | None, bool]] = {}
-        for line in output.splitlines():
-            if not line.strip():
+        patches: dict[str, str] = {}
+        for chunk in _DIFF_HEADER_RE.split(output):
+            if not chunk.startswith("diff --git "):
                 continue
-            ins, dels, path = line.split("\t", 2)
-            binary_flag = ins == "-" or dels == "-"
-            insertions = None if binary_flag else int(ins)
-            deletions = None if binary_flag else int(dels)
-            result[path] = (insertions, deletions, binary_flag)
-        return result
+            header = chunk.split("\n", 1)[0]
+            path = _path_from_diff_header(header[len("diff --git ") :])
+            if path is not None:
+                patches[path] = chunk.strip()
+        return patches
+
+
+def _branch_candidates(branch: str) -> list[str]:
+    """Return the refs tried for *branch*: local, origin/, remotes/origin/."""
+    return [branch, f"origin/{branch}", f"remotes/origin/{branch}"]
+
+
+def _path_from_diff_header(paths: str) -> str | None:
+    """Extract the path from the ``a/<path> b/<path>`` part of a diff header.
+
+    Without rename detection both sides name the same path, so the split point
+    follows from the length. Paths with special characters are C-quoted by git.
+    """
+    if paths.startswith('"'):
+        quoted = paths[3 : 3 + (len(paths) - 9) // 2]
+        if paths != f'"a/{quoted}" "b/{quoted}"':
+            return None
+        return _unquote_path(quoted)
+    path = paths[2 : 2 + (len(paths) - 5) // 2]
+    if paths != f"a/{path} b/{path}":
+        return None
+    return path
+
+
+_C_ESCAPES = {"a": 7, "b": 8, "t": 9, "n": 10, "v": 11, "f": 12, "r": 13}
+
+
+def _unquote_path(quoted: str) -> str:
+    """Undo git's C-style path quoting (backslash escapes and octal UTF-8 bytes)."""
+    raw = bytearray()
+    i = 0
+    while i < len(quoted):
+        char = quoted[i]
+        if char != "\\" or i + 1 == len(quoted):
+            raw += char.encode("utf-8")
+            i += 1
+        elif quoted[i + 1] in "01234567":
+            raw.append(int(quoted[i + 1 : i + 4], 8))
+            i += 4
+        else:
+            escaped = quoted[i + 1]
+            raw.append(_C_ESCAPES.get(escaped, ord(escaped)))
+            i += 2
+    return raw.decode("utf-8", errors="replace")
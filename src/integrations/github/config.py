@@ -1,6 +1,7 @@
 from typing import Any
 
 from core.config import BaseConfig
+from core.utils.config_utils import parse_bool
 
 
 class GitHubConfig:
@@ -55,11 +56,7 @@ class GitHubConfig:
 
     def get_use_mocks(self) -> bool:
         """Get the GitHub mock mode setting."""
-        mock_value = self._base_config.get_value("github.mock", "false")
-        # Handle both boolean and string representations
-        if isinstance(mock_value, bool):
-            return mock_value
-        return str(mock_value).lower() in ("true", "1", "yes", "on")
+        return parse_bool(self._base_config.get_value("github.mock", "false"))
 
     def is_configured(self) -> bool:
         """Check if all required GitHub configuration is present."""
@@ -67,10 +64,10 @@ class GitHubConfig:
         if self.get_use_mocks():
             return True
 
-        required_fields = [
-            self.get_api_url(),
-            self.get_owner(),
-            self.get_repo(),
-            self.get_token(),
-        ]
-        return all(field is not None and field != "" for field in required_fields)
+        required_getters = (
+            self.get_api_url,
+            self.get_owner,
+            self.get_repo,
+            self.get_token,
+        )
+        return all(getter() not in (None, "") for getter in required_getters)
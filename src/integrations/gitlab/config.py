@@ -1,5 +1,7 @@
 from typing import Any
 
+from core.utils.config_utils import parse_bool
+
 
 class GitLabConfig:
     """GitLab specific configuration class that works with project config subsets."""
@@ -11,6 +13,7 @@ class GitLabConfig:
             config_data: GitLab configuration dictionary
         """
         self._config_data = config_data or {}
+        self._use_mocks = parse_bool(self._config_data.get("mock", False))
 
     def get_api_url(self) -> str | None:
         """Get the GitLab API URL."""
@@ -26,11 +29,7 @@ class GitLabConfig:
 
     def get_use_mocks(self) -> bool:
         """Get the GitLab mock mode setting."""
-        mock_value = self._config_data.get("mock", "false")
-        # Handle both boolean and string representations
-        if isinstance(mock_value, bool):
-            return mock_value
-        return str(mock_value).lower() in ("true", "1", "yes", "on")
+        return self._use_mocks
 
     def is_configured(self) -> bool:
         """Check if all required GitLab configuration is present."""
@@ -38,5 +37,5 @@ class GitLabConfig:
         if self.get_use_mocks():
             return True
 
-        required_fields = [self.get_api_url(), self.get_project_id(), self.get_token()]
-        return all(field is not None and field != "" for field in required_fields)
+        required_getters = (self.get_api_url, self.get_project_id, self.get_token)
+        return all(getter() not in (None, "") for getter in required_getters)
@@ -1,25 +1,33 @@
 from pathlib import Path
 from typing import Any, cast
+import copy
+import functools
 import json
 
 from .models import Issue, MergeRequest, Pipeline
 
+_MOCKS_ROOT = Path(__file__).resolve().parent
+
 
 def _load_mock_file(file_path: str) -> dict[str, Any] | list[Any] | None:
     """Helper function to load mock data from a JSON file.
 
+    Each file is parsed once per process; every call returns a fresh copy, so
+    callers may modify the result.
+
     Args:
         file_path: Path to the mock JSON file
 
     Returns:
         Loaded JSON data as dictionary, list, or None if error
     """
-    try:
-        # Get the directory of this file
-        current_dir = Path(__file__).resolve().parent
-        full_path = current_dir / file_path
+    return copy.deepcopy(_read_mock_file(file_path))
 
-        with full_path.open(encoding="utf-8") as file:
+
+@functools.cache
+def _read_mock_file(file_path: str) -> dict[str, Any] | list[Any] | None:
+    try:
+        with (_MOCKS_ROOT / file_path).open(encoding="utf-8") as file:
             return cast("dict[str, Any] | list[Any]", json.load(file))
     except (FileNotFoundError, json.JSONDecodeError) as e:
         print(f"Error loading mock file {file_path}: {e}")
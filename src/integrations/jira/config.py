@@ -1,5 +1,7 @@
 from typing import Any
 
+from core.utils.config_utils import parse_bool
+
 
 class JiraConfig:
     """Jira specific configuration class that works with project config subsets."""
@@ -11,6 +13,7 @@ class JiraConfig:
             config_data: Jira configuration dictionary
         """
         self._config_data = config_data or {}
+        self._use_mocks = parse_bool(self._config_data.get("mock", False))
 
     def get_domain(self) -> str | None:
         """Get the Jira domain (e.g., 'company' for company.atlassian.net)."""
@@ -26,11 +29,7 @@ class JiraConfig:
 
     def get_use_mocks(self) -> bool:
         """Get the Jira mock mode setting."""
-        mock_value = self._config_data.get("mock", "false")
-        # Handle both boolean and string representations
-        if isinstance(mock_value, bool):
-            return mock_value
-        return str(mock_value).lower() in ("true", "1", "yes", "on")
+        return self._use_mocks
 
     def get_image_model(self) -> str | None:
         """Get the model for image analysis (e.g., 'openai:gpt-4o').
@@ -47,5 +46,5 @@ class JiraConfig:
         if self.get_use_mocks():
             return True
 
-        required_fields = [self.get_domain(), self.get_email(), self.get_token()]
-        return all(field is not None and field != "" for field in required_fields)
+        required_getters = (self.get_domain, self.get_email, self.get_token)
+        return all(getter() not in (None, "") for getter in required_getters)
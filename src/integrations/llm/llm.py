@@ -1,5 +1,7 @@
 from collections.abc import Callable
 from typing import TYPE_CHECKING
+import functools
+import logging
 
 from pydantic_ai import Agent
 from pydantic_ai.usage import RunUsage
@@ -27,7 +29,13 @@ except ImportError:
 logger = get_logger(logger_name="LLM", level="DEBUG")
 
 
-def _create_agent(model_full_name: str) -> Agent[None, str]:
+@functools.lru_cache(maxsize=32)
+def _get_agent(model_full_name: str) -> Agent[None, str]:
+    """Return the shared text agent for *model_full_name*.
+
+    Agents hold no per-run state, so one instance per model is reused instead
+    of re-resolving the model and its client on every call.
+    """
     return Agent(
         model=model_full_name,
         output_type=str,
@@ -49,10 +57,13 @@ def _track_usage_for_model(model_full_name: str, usage: RunUsage | None) -> None
 
 
 def invoke_llm(prompt_text: str, model_full_name: str) -> str:
-    logger.info(
-        f"Invoking LLM with model={model_full_name}, prompt_text[:200]={prompt_text[:200]!r}"
-    )
-    agent = _create_agent(model_full_name)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Invoking LLM with model=%s, prompt_text[:200]=%r",
+            model_full_name,
+            prompt_text[:200],
+        )
+    agent = _get_agent(model_full_name)
     result = agent.run_sync(prompt_text)
 
     # Track usage after execution
@@ -62,10 +73,13 @@ def invoke_llm(prompt_text: str, model_full_name: str) -> str:
 
 
 async def invoke_llm_async(prompt_text: str, model_full_name: str) -> str:
-    logger.info(
-        f"Invoking LLM async with model={model_full_name}, prompt_text[:200]={prompt_text[:200]!r}"
-    )
-    agent = _create_agent(model_full_name)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Invoking LLM async with model=%s, prompt_text[:200]=%r",
+            model_full_name,
+            prompt_text[:200],
+        )
+    agent = _get_agent(model_full_name)
     result = await agent.run(prompt_text)
 
     # Track usage after execution
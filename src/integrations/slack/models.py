@@ -1,28 +1,47 @@
-from typing import cast
+from typing import Any, cast
 
 from core.config import BaseConfig
+from core.utils.config_utils import parse_bool
 
 
 class SlackBotConfig:
-    """Configuration for Slack bot service."""
+    """Configuration for Slack bot service.
+
+    Settings are read from the base config once at construction.
+    """
 
     def __init__(self, base_config: BaseConfig):
         self._base_config = base_config
         self._config_data = base_config.get_config_data()
+        self._bot_token = cast("str", base_config.get_value("slack.bot.botToken", ""))
+        self._app_token = cast("str", base_config.get_value("slack.bot.appToken", ""))
+        self._processing_timeout: Any = base_config.get_value(
+            "slack.bot.processingTimeout", 6000
+        )
+        self._max_connection_failures: Any = base_config.get_value(
+            "slack.bot.maxConnectionFailures", 5
+        )
+        self._persist_user_names = parse_bool(
+            base_config.get_value("slack.bot.persistUserNames", False)
+        )
 
     def get_bot_token(self) -> str:
-        return cast("str", self._base_config.get_value("slack.bot.botToken", ""))
+        return self._bot_token
 
     def get_app_token(self) -> str:
-        return cast("str", self._base_config.get_value("slack.bot.appToken", ""))
+        return self._app_token
 
     def get_processing_timeout(self) -> int:
-        return int(self._base_config.get_value("slack.bot.processingTimeout", 6000))
+        return int(self._processing_timeout)
 
     def get_max_connection_failures(self) -> int:
         """Get the maximum number of consecutive connection failures before shutdown."""
-        return int(self._base_config.get_value("slack.bot.maxConnectionFailures", 5))
+        return int(self._max_connection_failures)
+
+    def get_persist_user_names(self) -> bool:
+        """Whether resolved user names are also kept in project storage."""
+        return self._persist_user_names
 
     def is_configured(self) -> bool:
         """Check if all required Slack configuration is present."""
-        return bool(self.get_bot_token() and self.get_app_token())
+        return bool(self._bot_token and self._app_token)
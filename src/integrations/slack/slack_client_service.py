@@ -1,7 +1,10 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import UTC
+from datetime import UTC, datetime
 from typing import Any, cast
+import contextvars
+import re
 import threading
 
 from slack_sdk import WebClient
@@ -12,8 +15,18 @@ from slack_sdk.socket_mode.request import SocketModeRequest
 from slack_sdk.socket_mode.response import SocketModeResponse
 
 from core.log import get_logger
+from core.storage import get_storage
 from integrations.slack.models import SlackBotConfig
 from integrations.slack.thread_participant_tracker import ThreadParticipantTracker
+from integrations.slack.user_name_cache import UserNameCache
+
+# Slack user mention, e.g. <@U123>
+_MENTION_RE = re.compile(r"<@([A-Z0-9]+)>")
+# Upper bound for concurrent users_info requests while resolving mentions
+_MAX_PARALLEL_USER_LOOKUPS = 8
+# Back-off in seconds between failed initial Socket Mode connection attempts
+_SOCKET_CONNECT_INITIAL_BACKOFF = 1.0
+_SOCKET_CONNECT_MAX_BACKOFF = 60.0
 
 
 @dataclass
@@ -33,17 +46,26 @@ class SlackClientService:
         # Setup logging using centralized log file path utility
         self.log = get_logger(logger_name="SlackClientService", level="INFO")
         # Logging configuration is now DRY and managed in one place via get_log_file_path.
-        self.user_info_cache: dict[str, dict[str, Any]] = {}  # Cache for user info
 
         # Load Slack tokens from config
         if not slack_config:
             raise ValueError("SlackClientService requires slack_config parameter")
 
+        # Real names by user ID; bounded and expiring so renames are picked up,
+        # and optionally persisted so a restart does not look every user up again
+        self.user_name_cache = UserNameCache(
+            storage=get_storage() if slack_config.get_persist_user_names() else None
+        )
+        # Every user whose name was resolved since startup; canvases are shared
+        # with them for editing. Kept apart from the name cache so expiry or
+        # eviction of a name does not revoke canvas access.
+        self._canvas_user_ids: set[str] = set()
+        self._canvas_users_lock = threading.Lock()
+
         self.bot_token = slack_config.get_bot_token()
         app_token = slack_config.get_app_token()
 
         self.client = WebClient(token=self.bot_token)
-        self.user_info_cache = {}
 
         # Message callback for real-time processing
         self.message_callback: Callable[[dict[str, Any]], None] | None = None
@@ -65,6 +87,8 @@ class SlackClientService:
         self.socket_client.socket_mode_request_listeners.append(
             self._socket_event_handler
         )
+        self._socket_thread: threading.Thread | None = None
+        self._socket_stop = threading.Event()
 
         # try to getting the ID bot
         self.bot_id: str | None = None
@@ -86,21 +110,33 @@ class SlackClientService:
             ThreadParticipantTracker(bot_id=self.bot_id) if self.bot_id else None
         )
 
-    def get_user_real_name(self, user_id: str) -> str:
-        if user_id in self.user_info_cache:
-            user_info = self.user_info_cache[user_id]
-        else:
+    def get_user_real_name(self, user_id: str) -> str | None:
+        """Return the user's real name, or None if it could not be looked up."""
+        name = self.user_name_cache.get(user_id)
+        if name is None:
+            name = self._fetch_user_real_name(user_id)
+        if name is not None:
+            self._add_canvas_users([user_id])
+        return name
+
+    def _fetch_user_real_name(self, user_id: str) -> str | None:
+        """Look the user up via users_info and cache the resolved name."""
+        try:
             response = self.client.users_info(user=user_id)
-            # Handle SlackResponse or dict response
-            if hasattr(response, "data") and isinstance(response.data, dict):
-                user_info = response.data
-            elif isinstance(response, dict):
-                user_info = response
-            else:
-                user_info = {}
-            self.user_info_cache[user_id] = user_info
+        except Exception as e:
+            self.log.warning("Could not get real name for user %s: %s", user_id, e)
+            return None
+        # Handle SlackResponse or dict response
+        if hasattr(response, "data") and isinstance(response.data, dict):
+            user_info = response.data
+        elif isinstance(response, dict):
+            user_info = response
+        else:
+            user_info = {}
         real_name = user_info.get("user", {}).get("real_name", "unknown")
-        return str(real_name) if real_name is not None else "unknown"
+        name = str(real_name) if real_name is not None else "unknown"
+        self.user_name_cache.set(user_id, name)
+        return name
 
     def get_thread_conversation(
         self, channel_id: str, thread_ts: str
@@ -134,20 +170,79 @@ class SlackClientService:
         Returns:
             Text with user mentions replaced with real names
         """
-        import re
+        if "<@" not in text:
+            return text
+
+        # split() yields [text, user_id, text, user_id, ..., text]
+        parts = _MENTION_RE.split(text)
+        user_ids = parts[1::2]
+        names = self._resolve_real_names(set(user_ids))
+
+        out = [parts[0]]
+        for user_id, following_text in zip(user_ids, parts[2::2], strict=True):
+            real_name = names[user_id]
+            if real_name is None:
+                out.append(f"<@{user_id}>")  # Keep original mention if error
+            else:
+                out.append(f"@{real_name} <{user_id}>")
+            out.append(following_text)
+        return "".join(out)
 
-        def replace_mention(match: Any) -> str:
-            user_id = match.group(1)
-            try:
-                real_name = self.get_user_real_name(user_id)
-                return f"@{real_name} <{user_id}>"
-            except Exception as e:
-                self.log.warning(f"Could not get real name for user {user_id}: {e}")
-                return str(match.group(0))  # Return original mention if error
+    def _resolve_real_names(self, user_ids: set[str]) -> dict[str, str | None]:
+        """Map each user ID to its real name, or None if the lookup failed.
 
-        # Pattern to match <@USER_ID>
-        mention_pattern = r"<@([A-Z0-9]+)>"
-        return re.sub(mention_pattern, replace_mention, text)
+        Users that are not cached yet are looked up in parallel, so a message
+        with several new mentions costs about one users_info round-trip.
+        """
+        names: dict[str, str | None] = {}
+        missing: list[str] = []
+        for user_id in user_ids:
+            cached_name = self.user_name_cache.get(user_id)
+            if cached_name is None:
+                missing.append(user_id)
+            else:
+                names[user_id] = cached_name
+        if len(missing) > 1:
+            # WebClient is safe to share between threads; each lookup runs in a
+            # copy of the current context so its log lines keep the thread token
+            with ThreadPoolExecutor(
+                max_workers=min(len(missing), _MAX_PARALLEL_USER_LOOKUPS)
+            ) as pool:
+                futures = {
+                    user_id: pool.submit(
+                        contextvars.copy_context().run,
+                        self._fetch_user_real_name,
+                        user_id,
+                    )
+                    for user_id in missing
+                }
+            names.update(
+                (user_id, future.result()) for user_id, future in futures.items()
+            )
+        elif missing:
+            names[missing[0]] = self._fetch_user_real_name(missing[0])
+        self._add_canvas_users(
+            user_id for user_id, name in names.items() if name is not None
+        )
+        return names
+
+    def _add_canvas_users(self, user_ids: Iterable[str]) -> None:
+        """Record users that canvases posted from now on are shared with."""
+        with self._canvas_users_lock:
+            self._canvas_user_ids.update(user_ids)
+
+    def prefetch_user_names(self, messages: list[dict[str, Any]]) -> None:
+        """Warm the user name cache for all authors and mentions in *messages*.
+
+        Uncached users are looked up in parallel, so converting a thread with
+        many new participants does not cost one users_info round-trip each.
+        """
+        user_ids = {msg["user"] for msg in messages if msg.get("user")}
+        for msg in messages:
+            text = msg.get("text", "")
+            if "<@" in text:
+                user_ids.update(_MENTION_RE.findall(text))
+        self._resolve_real_names(user_ids)
 
     def _create_markdown_block(self, text: str) -> dict[str, Any]:
         """Create a single Slack markdown block.
@@ -176,8 +271,7 @@ class SlackClientService:
         Returns:
             SlackMessage object
         """
-        from datetime import datetime
-
+        # Imported here: slack_bot_service imports this module
         from entrypoints.slack_entrypoint.slack_bot_service import SlackMessage
 
         message_id = slack_msg.get("ts", "")
@@ -189,12 +283,8 @@ class SlackClientService:
 
         # Get user info
         user_id = slack_msg.get("user", "")
-        try:
-            username = (
-                self.get_user_real_name(user_id) if user_id else fallback_username
-            )
-        except Exception:
-            username = fallback_username
+        real_name = self.get_user_real_name(user_id) if user_id else None
+        username = real_name or fallback_username
 
         # Process content to replace user mentions with real names
         raw_content = slack_msg.get("text", "")
@@ -417,15 +507,16 @@ class SlackClientService:
             if post_message:
                 # Step 1: Set access for channel and cached users
                 try:
-                    cached_user_ids = list(self.user_info_cache.keys())
+                    with self._canvas_users_lock:
+                        canvas_user_ids = list(self._canvas_user_ids)
                     self.client.canvases_access_set(
                         canvas_id=canvas_id,
                         channel_ids=[channel_id],
-                        user_ids=cached_user_ids,
+                        user_ids=canvas_user_ids,
                         access_level="edit",
                     )
                     user_info = (
-                        f" and {len(cached_user_ids)} users" if cached_user_ids else ""
+                        f" and {len(canvas_user_ids)} users" if canvas_user_ids else ""
                     )
                     self.log.info(
                         f"Canvas access set for channel {channel_id}{user_info}"
@@ -556,8 +647,38 @@ class SlackClientService:
         self.message_callback = callback
 
     def start_socket_client(self) -> None:
-        """Start the Socket Mode client in a background thread."""
-        threading.Thread(target=self.socket_client.connect, daemon=True).start()
+        """Start the Socket Mode client in a background thread.
+
+        The initial connection is retried with exponential back-off until it
+        succeeds or stop_socket_client() is called; once connected, the SDK
+        reconnects on its own.
+        """
+        self._socket_stop.clear()
+        self._socket_thread = threading.Thread(
+            target=self._connect_socket_client, daemon=True
+        )
+        self._socket_thread.start()
+
+    def stop_socket_client(self) -> None:
+        """Stop connection attempts and close the Socket Mode client."""
+        self._socket_stop.set()
+        if self._socket_thread and self._socket_thread.is_alive():
+            self._socket_thread.join(timeout=5)
+        self.socket_client.close()
+
+    def _connect_socket_client(self) -> None:
+        backoff = _SOCKET_CONNECT_INITIAL_BACKOFF
+        while not self._socket_stop.is_set():
+            try:
+                self.socket_client.connect()
+                return
+            except Exception as e:
+                self.log.warning(
+                    "Socket Mode connection failed, retrying in %.1fs: %s", backoff, e
+                )
+                if self._socket_stop.wait(backoff):
+                    return
+                backoff = min(backoff * 2, _SOCKET_CONNECT_MAX_BACKOFF)
 
     def _socket_event_handler(
         self, client: BaseSocketModeClient, req: SocketModeRequest
@@ -576,10 +697,8 @@ class SlackClientService:
             try:
                 # Convert to standardized format
                 user_id = event.get("user", "")
-                try:
-                    user_name = self.get_user_real_name(user_id)
-                except Exception:
-                    user_name = "unknown"
+                real_name = self.get_user_real_name(user_id) if user_id else None
+                user_name = real_name or "unknown"
 
                 channel_id = event.get("channel", "")
                 thread_ts = event.get("thread_ts", event.get("ts"))
@@ -0,0 +1,104 @@
+"""Bounded, expiring cache of Slack user real names."""
+
+from collections import OrderedDict
+import threading
+import time
+
+from core.storage import BaseStorage
+
+
+def _storage_key(user_id: str) -> str:
+    return f"slack_user_{user_id}"
+
+
+class UserNameCache:
+    """Thread-safe LRU cache mapping Slack user IDs to real names.
+
+    Entries expire after *ttl_seconds* so renamed users are picked up again,
+    and the least recently used entry is dropped once *max_size* is exceeded.
+    With a *storage* backend, names are also persisted (with the same expiry)
+    so a restarted bot does not have to look every user up again; expired and
+    evicted entries are removed from storage as well.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        ttl_seconds: float = 1800,
+        storage: BaseStorage | None = None,
+    ) -> None:
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._storage = storage
+        # user_id -> (expires_at, real_name), least recently used first
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Serializes storage access; FileStorage writes are not atomic
+        self._storage_lock = threading.Lock()
+
+    def get(self, user_id: str) -> str | None:
+        """Return the cached real name, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None:
+                expires_at, real_name = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(user_id)
+                    return real_name
+                del self._entries[user_id]
+        return self._load(user_id)
+
+    def set(self, user_id: str, real_name: str) -> None:
+        """Cache *real_name* for *user_id*, evicting the oldest entries if full."""
+        self._remember(user_id, real_name, self._ttl_seconds)
+        if self._storage is not None:
+            with self._storage_lock:
+                self._storage.set(
+                    _storage_key(user_id),
+                    {
+                        "real_name": real_name,
+                        "expires_at": time.time() + self._ttl_seconds,
+                    },
+                )
+
+    def _remember(self, user_id: str, real_name: str, ttl_seconds: float) -> None:
+        evicted: list[str] = []
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + ttl_seconds, real_name)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self._max_size:
+                evicted.append(self._entries.popitem(last=False)[0])
+        if evicted and self._storage is not None:
+            # Keep the persisted tier within the same bound as memory
+            with self._storage_lock:
+                for evicted_id in evicted:
+                    self._storage.delete(_storage_key(evicted_id))
+
+    def _load(self, user_id: str) -> str | None:
+        """Return a persisted, unexpired name and keep it in memory.
+
+        Expired or unreadable entries are deleted from storage.
+        """
+        if self._storage is None:
+            return None
+        key = _storage_key(user_id)
+        with self._storage_lock:
+            entry = self._storage.get(key)
+            if entry is None:
+                return None
+            real_name = entry.get("real_name") if isinstance(entry, dict) else None
+            expires_at = entry.get("expires_at") if isinstance(entry, dict) else None
+            if (
+                not isinstance(real_name, str)
+                or not isinstance(expires_at, int | float)
+                or expires_at <= time.time()
+            ):
+                self._storage.delete(key)
+                return None
+        self._remember(user_id, real_name, expires_at - time.time())
+        return real_name
+
+    def user_ids(self) -> list[str]:
+        """Return the IDs of all users currently held in the cache."""
+        with self._lock:
+            return list(self._entries)
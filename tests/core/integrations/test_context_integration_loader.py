@@ -0,0 +1,53 @@
+from unittest.mock import Mock, patch
+import threading
+
+import pytest
+
+from core.integrations.context_integration_loader import ContextIntegrationLoader
+from core.project_config import ProjectConfig
+from core.protocols.provider_protocols import PullRequestModel
+
+
+class TestContextIntegrationLoaderBranches:
+    """Test cases for ContextIntegrationLoader.get_branches_from_pr."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.loader = ContextIntegrationLoader(Mock(spec=ProjectConfig))
+        self.loader._pr_cache["42"] = PullRequestModel(
+            id="42",
+            context="PR 42",
+            source_refs=["feature/x"],
+            target_refs=["main"],
+        )
+
+    @pytest.mark.asyncio
+    async def test_refs_resolve_off_the_event_loop(self):
+        """Test that both refs resolve with one repository in a worker thread."""
+        threads: list[threading.Thread] = []
+
+        def resolve(refs):
+            threads.append(threading.current_thread())
+            return f"origin/{refs[0]}"
+
+        with patch(
+            "core.integrations.context_integration_loader.GitRepository"
+        ) as mock_repo_class:
+            mock_repo_class.return_value.resolve_refs_to_branch.side_effect = resolve
+
+            branches = await self.loader.get_branches_from_pr("42")
+
+        assert branches == ("origin/feature/x", "origin/main")
+        mock_repo_class.assert_called_once()
+        assert threading.main_thread() not in threads
+
+    @pytest.mark.asyncio
+    async def test_unresolved_refs_raise(self):
+        """Test that a missing branch raises ValueError."""
+        with patch(
+            "core.integrations.context_integration_loader.GitRepository"
+        ) as mock_repo_class:
+            mock_repo_class.return_value.resolve_refs_to_branch.return_value = None
+
+            with pytest.raises(ValueError, match="could not resolve"):
+                await self.loader.get_branches_from_pr("42")
@@ -1,4 +1,6 @@
+from collections.abc import Mapping
 from pathlib import Path
+from unittest.mock import patch
 import os
 import tempfile
 import threading
@@ -52,7 +54,7 @@ test_section:
         """Test getting full config data."""
         config = BaseConfig()
         data = config.get_config_data()
-        assert isinstance(data, dict)
+        assert isinstance(data, Mapping)
 
     def test_get_value_existing_key(self):
         """Test getting value for existing key."""
@@ -131,6 +133,85 @@ test_section:
             if "DYNACONF_TEST_SECTION_OVERRIDE" in os.environ:
                 del os.environ["DYNACONF_TEST_SECTION_OVERRIDE"]
 
+    def test_templated_value_follows_later_env_changes(self, monkeypatch):
+        """Test @jinja values are rendered on access, not frozen at load time."""
+        monkeypatch.delenv("TEST_LATE_MODEL", raising=False)
+        test_config = """
+test_section:
+  static_value: "static_content"
+  model: "@jinja {{ env.TEST_LATE_MODEL or 'default:model' }}"
+"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
+            f.write(test_config)
+            temp_path = f.name
+
+        try:
+            config = BaseConfig(temp_path)
+            assert config.get_value("test_section.model") == "default:model"
+
+            monkeypatch.setenv("TEST_LATE_MODEL", "late:model")
+            assert config.get_value("test_section.model") == "late:model"
+            assert config.get_value("test_section")["model"] == "late:model"
+            assert config.get_value("test_section.static_value") == "static_content"
+        finally:
+            Path(temp_path).unlink()
+
+    def test_templated_value_is_rendered_once_per_env_state(self, monkeypatch):
+        """Test rendered values are reused until an env var they read changes."""
+        from dynaconf.base import Settings
+
+        monkeypatch.delenv("TEST_LATE_URL", raising=False)
+        test_config = """
+test_section:
+  url: "@jinja {{ env.get('TEST_LATE_URL', 'http://default') }}"
+  alias: "@jinja {{ this.test_section.url }}"
+"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
+            f.write(test_config)
+            temp_path = f.name
+
+        try:
+            config = BaseConfig(temp_path)
+            with patch.object(
+                Settings, "get", autospec=True, side_effect=Settings.get
+            ) as mock_get:
+                assert config.get_value("test_section.alias") == "http://default"
+                renders = mock_get.call_count
+                assert renders > 0
+                assert config.get_value("test_section.alias") == "http://default"
+                assert mock_get.call_count == renders
+
+                monkeypatch.setenv("TEST_LATE_URL", "http://late")
+                assert config.get_value("test_section.alias") == "http://late"
+                assert mock_get.call_count > renders
+        finally:
+            Path(temp_path).unlink()
+
+    def test_config_data_is_read_only_and_matches_get_value(self, monkeypatch):
+        """Test get_config_data() is a read-only view consistent with get_value()."""
+        monkeypatch.delenv("TEST_LATE_MODEL", raising=False)
+        test_config = """
+test_section:
+  model: "@jinja {{ env.TEST_LATE_MODEL or 'default:model' }}"
+"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
+            f.write(test_config)
+            temp_path = f.name
+
+        try:
+            config = BaseConfig(temp_path)
+            data = config.get_config_data()
+            assert data["TEST_SECTION"]["model"] == "default:model"
+            assert config.get_config_data() is data
+            with pytest.raises(TypeError):
+                data["TEST_SECTION"] = {}
+
+            monkeypatch.setenv("TEST_LATE_MODEL", "late:model")
+            assert config.get_config_data()["TEST_SECTION"]["model"] == "late:model"
+            assert config.get_value("test_section.model") == "late:model"
+        finally:
+            Path(temp_path).unlink()
+
     def test_integration_with_real_config(self):
         """Test integration with the actual project config file."""
         config = BaseConfig()
@@ -229,7 +310,7 @@ class TestDefaultConfigSingleton:
         # The default config should have some expected structure
         # (This will depend on your actual config.yaml content)
         config_data = config.get_config_data()
-        assert isinstance(config_data, dict)
+        assert isinstance(config_data, Mapping)
 
     def test_get_default_config_thread_safety(self):
         """Test that get_default_config() is thread-safe."""
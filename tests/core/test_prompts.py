@@ -121,6 +121,26 @@ test_prompts:
             if "TEST_PROMPTS__ENV_PROMPT" in os.environ:
                 del os.environ["TEST_PROMPTS__ENV_PROMPT"]
 
+    def test_templated_prompt_follows_later_env_changes(self, monkeypatch):
+        """Test @jinja prompts are rendered on access, not frozen at load time."""
+        monkeypatch.delenv("TEST_LATE_NAME", raising=False)
+        test_prompts = """
+avatar:
+  fullName: "@jinja {{ env.TEST_LATE_NAME or 'Default Name' }}"
+"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            f.write(test_prompts)
+            temp_path = f.name
+
+        try:
+            prompts = BasePrompts(temp_path)
+            assert prompts.get_prompt("avatar.fullName") == "Default Name"
+
+            monkeypatch.setenv("TEST_LATE_NAME", "Late Name")
+            assert prompts.get_prompt("avatar.fullName") == "Late Name"
+        finally:
+            Path(temp_path).unlink()
+
     def test_multiline_prompt_handling(self):
         """Test handling of multiline prompts."""
         test_prompts = """
@@ -178,6 +178,36 @@ projects:
         assert isinstance(provider, MockIssueProvider)
         assert provider.name == "test-mock"
 
+    def test_resolve_provider_is_cached_per_project_config(self):
+        """Test that a resolved provider is reused and reset on registration."""
+        config_content = """
+projects:
+  test_project:
+    git:
+      path: "/test/repo"
+    pullrequests:
+      mock:
+        enabled: true
+        name: "test-mock"
+"""
+        self.registry.register_pullrequest_provider(
+            "mock", MockPullRequestProvider.from_config
+        )
+        project_config = self._create_test_project_config(config_content)
+
+        first = self.registry.resolve_pullrequest_provider(project_config)
+        second = self.registry.resolve_pullrequest_provider(project_config)
+        assert first is not None
+        assert first is second
+
+        # Registering a provider invalidates previously resolved providers
+        self.registry.register_pullrequest_provider(
+            "mock", MockPullRequestProvider.from_config
+        )
+        third = self.registry.resolve_pullrequest_provider(project_config)
+        assert third is not None
+        assert third is not first
+
     def test_resolve_provider_no_match(self):
         """Test provider resolution when no providers match."""
         config_content = """
@@ -0,0 +1,15 @@
+import pytest
+
+from core.utils.config_utils import parse_bool
+
+
+class TestParseBool:
+    """Test cases for parse_bool."""
+
+    @pytest.mark.parametrize("value", [True, "true", "TRUE", "1", 1, "yes", "On"])
+    def test_truthy_values(self, value):
+        assert parse_bool(value) is True
+
+    @pytest.mark.parametrize("value", [False, "false", "0", 0, "no", "off", "", None])
+    def test_falsy_values(self, value):
+        assert parse_bool(value) is False
@@ -5,6 +5,7 @@ import subprocess
 import pytest
 
 from core.project_config import ProjectConfig
+from integrations.git.changed_file import ChangedFile, ChangedFileSet
 from integrations.git.git_repository import GitRepository
 
 
@@ -267,3 +268,324 @@ This fixes the login issue that was causing users to be unable to access their a
             # Verify actual date ordering
             for i in range(len(commits) - 1):
                 assert commits[i].date >= commits[i + 1].date
+
+
+class TestGitRepositoryChangedFileSet:
+    """Test cases for GitRepository _get_changed_file_set patch extraction."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.mock_project_config = Mock(spec=ProjectConfig)
+
+        with patch(
+            "integrations.git.git_repository.GitRepositoryConfig"
+        ) as mock_git_config_class:
+            mock_git_config = Mock()
+            mock_git_config.get_repo_dir.return_value = "/fake/repo/path"
+            mock_git_config.get_auto_pull.return_value = False
+            mock_git_config_class.from_project_config.return_value = mock_git_config
+
+            self.git_repo = GitRepository(self.mock_project_config)
+
+    def test_patches_come_from_a_single_diff(self):
+        """Test that all patches are split out of one combined git diff."""
+        raw_numstat = "\0".join(
+            [
+                ":100644 100644 1111111 2222222 M",
+                "src/a.py",
+                ":000000 100644 0000000 3333333 A",
+                "sp ace.txt",
+                ":100644 100644 4444444 5555555 M",
+                'q"t.txt',
+                ":000000 100644 0000000 6666666 A",
+                "image.png",
+                "1\t0\tsrc/a.py",
+                "1\t0\tsp ace.txt",
+                '1\t0\tq"t.txt',
+                "-\t-\timage.png",
+                "",
+            ]
+        )
+        combined = (
+            "diff --git a/src/a.py b/src/a.py\n"
+            "index 1..2 100644\n"
+            "+diff --git a/not/a/header b/not/a/header\n"
+            "diff --git a/sp ace.txt b/sp ace.txt\n"
+            "new file mode 100644\n"
+            "+s\n"
+            'diff --git "a/q\\"t.txt" "b/q\\"t.txt"\n'
+            "+q\n"
+            "diff --git a/image.png b/image.png\n"
+            "Binary files differ"
+        )
+
+        def git_output(cmd):
+            if "--raw" in cmd:
+                return raw_numstat
+            if "--no-renames" in cmd:
+                return combined
+            raise AssertionError(f"unexpected git call: {cmd}")
+
+        with (
+            patch.object(self.git_repo, "_resolve_branch") as mock_resolve,
+            patch.object(self.git_repo, "_git_output") as mock_git_output,
+        ):
+            mock_resolve.side_effect = lambda x: x
+            mock_git_output.side_effect = git_output
+
+            changed = self.git_repo._get_changed_file_set(
+                "feature", "main", include_patch=True
+            )
+
+        assert mock_git_output.call_count == 2
+        patches = {f.path: f.patch for f in changed.files}
+        assert patches["src/a.py"] == (
+            "diff --git a/src/a.py b/src/a.py\n"
+            "index 1..2 100644\n"
+            "+diff --git a/not/a/header b/not/a/header"
+        )
+        assert patches["sp ace.txt"].endswith("+s")
+        assert patches['q"t.txt'].endswith("+q")
+        assert patches["image.png"] is None
+
+    def test_unmatched_path_falls_back_to_per_file_diff(self):
+        """Test that a path missing from the combined diff is diffed on its own."""
+
+        def git_output(cmd):
+            if "--raw" in cmd:
+                return ":100644 100644 1111111 2222222 M\0src/a.py\x001\t0\tsrc/a.py\0"
+            if "--no-renames" in cmd:
+                return ""
+            return "per-file patch"
+
+        with (
+            patch.object(self.git_repo, "_resolve_branch") as mock_resolve,
+            patch.object(self.git_repo, "_git_output") as mock_git_output,
+        ):
+            mock_resolve.side_effect = lambda x: x
+            mock_git_output.side_effect = git_output
+
+            changed = self.git_repo._get_changed_file_set(
+                "feature", "main", include_patch=True
+            )
+
+        assert changed.files[0].patch == "per-file patch"
+        assert mock_git_output.call_args[0][0] == [
+            "git",
+            "diff",
+            "main...feature",
+            "--",
+            "src/a.py",
+        ]
+
+    def test_metadata_totals_skip_binary_files(self):
+        """Test that diff metadata sums line counts and ignores binary files."""
+        changed = ChangedFileSet(
+            source_branch="feature",
+            target_branch="main",
+            files=[
+                ChangedFile(path="a.py", status="M", insertions=3, deletions=1),
+                ChangedFile(path="b.py", status="A", insertions=5, deletions=0),
+                ChangedFile(path="image.png", status="A", binary=True),
+            ],
+        )
+
+        with patch.object(self.git_repo, "_get_changed_file_set", return_value=changed):
+            diff = self.git_repo.get_diff_from_branches("feature", "main")
+
+        assert diff.metadata.total_files_changed == 3
+        assert diff.metadata.line_counts == {
+            "insertions": 8,
+            "deletions": 1,
+            "total": 9,
+        }
+
+
+class TestGitRepositoryResolveRefs:
+    """Test cases for GitRepository ref resolution."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.mock_project_config = Mock(spec=ProjectConfig)
+
+        with patch(
+            "integrations.git.git_repository.GitRepositoryConfig"
+        ) as mock_git_config_class:
+            mock_git_config = Mock()
+            mock_git_config.get_repo_dir.return_value = "/fake/repo/path"
+            mock_git_config.get_auto_pull.return_value = False
+            mock_git_config_class.from_project_config.return_value = mock_git_config
+
+            self.git_repo = GitRepository(self.mock_project_config)
+
+    def test_resolve_branch_checks_candidates_in_one_call(self):
+        """Test that all candidates for a branch are checked by one git process."""
+        with patch.object(self.git_repo, "_git_output") as mock_git_output:
+            mock_git_output.return_value = "feature missing\n" + "a" * 40
+
+            assert self.git_repo._resolve_branch_safe("feature") == "origin/feature"
+
+            mock_git_output.assert_called_once_with(
+                ["git", "cat-file", "--batch-check=%(objectname)"],
+                stdin="feature\norigin/feature\nremotes/origin/feature\n",
+            )
+
+    def test_resolve_branch_is_cached_until_pull(self):
+        """Test that repeated resolutions reuse the cached result until a pull."""
+        with patch.object(self.git_repo, "_git_output") as mock_git_output:
+            mock_git_output.return_value = "a" * 40
+
+            assert self.git_repo._resolve_branch("main") == "main"
+            assert self.git_repo._resolve_branch("main") == "main"
+            assert mock_git_output.call_count == 1
+
+            self.git_repo.pull()
+            assert self.git_repo._resolve_branch("main") == "main"
+            # pull itself plus one fresh resolution
+            assert mock_git_output.call_count == 3
+
+    def test_resolve_refs_to_branch_returns_first_existing(self):
+        """Test that refs are tried in order with their remote candidates."""
+        with patch.object(self.git_repo, "_git_output") as mock_git_output:
+            mock_git_output.return_value = "\n".join(
+                [
+                    "gone missing",
+                    "origin/gone missing",
+                    "remotes/origin/gone missing",
+                    "b" * 40,
+                    "c" * 40,
+                ]
+            )
+
+            assert self.git_repo.resolve_refs_to_branch(["gone", "main"]) == "main"
+            assert mock_git_output.call_count == 1
+
+    def test_resolve_branch_not_found(self):
+        """Test that a branch with no existing candidate resolves to None."""
+        with patch.object(self.git_repo, "_git_output") as mock_git_output:
+            mock_git_output.return_value = "missing\n x missing\n y missing"
+
+            assert self.git_repo._resolve_branch_safe("") is None
+            with pytest.raises(ValueError):
+                self.git_repo._resolve_branch("")
+
+    def test_renames_are_keyed_by_new_path(self):
+        """Test that renamed files get both their status and their line counts."""
+        raw_numstat = "\0".join(
+            [
+                ":100644 100644 1111111 2222222 R087",
+                "old name.py",
+                "new name.py",
+                "3\t1\t",
+                "old name.py",
+                "new name.py",
+                "",
+            ]
+        )
+
+        with (
+            patch.object(self.git_repo, "_resolve_branch") as mock_resolve,
+            patch.object(self.git_repo, "_git_output") as mock_git_output,
+        ):
+            mock_resolve.side_effect = lambda x: x
+            mock_git_output.return_value = raw_numstat
+
+            changed = self.git_repo._get_changed_file_set("feature", "main")
+
+        assert mock_git_output.call_count == 1
+        [changed_file] = changed.files
+        assert changed_file.path == "new name.py"
+        assert changed_file.status == "R"
+        assert (changed_file.insertions, changed_file.deletions) == (3, 1)
+
+
+class TestGitRepositoryRealDiff:
+    """Test _get_changed_file_set against the output of a real git repository."""
+
+    @staticmethod
+    def _git(repo, *args):
+        subprocess.run(
+            [
+                "git",
+                "-c",
+                "user.name=Test",
+                "-c",
+                "user.email=test@example.com",
+                *args,
+            ],
+            cwd=repo,
+            check=True,
+            capture_output=True,
+        )
+
+    @pytest.fixture
+    def git_repo(self, tmp_path):
+        """Create a repository where *feature* renames, deletes and adds files."""
+        self._git(tmp_path, "init", "-q", "-b", "main")
+        (tmp_path / "keep.py").write_text("a = 1\n")
+        (tmp_path / "old name.py").write_text("".join(f"line {n}\n" for n in range(20)))
+        (tmp_path / "gone.py").write_text("print('bye')\n")
+        self._git(tmp_path, "add", "-A")
+        self._git(tmp_path, "commit", "-q", "-m", "base")
+
+        self._git(tmp_path, "checkout", "-q", "-b", "feature")
+        (tmp_path / "keep.py").write_text("a = 2\nb = 3\n")
+        self._git(tmp_path, "mv", "old name.py", "new name.py")
+        with (tmp_path / "new name.py").open("a") as f:
+            f.write("line 20\n")
+        self._git(tmp_path, "rm", "-q", "gone.py")
+        (tmp_path / "image.bin").write_bytes(b"\x00\x01\x02\xff" * 16)
+        (tmp_path / 'ünïcode "quoted".txt').write_text("hello\n")
+        self._git(tmp_path, "add", "-A")
+        self._git(tmp_path, "commit", "-q", "-m", "feature")
+
+        with patch(
+            "integrations.git.git_repository.GitRepositoryConfig"
+        ) as mock_git_config_class:
+            mock_git_config = Mock()
+            mock_git_config.get_repo_dir.return_value = str(tmp_path)
+            mock_git_config.get_auto_pull.return_value = False
+            mock_git_config_class.from_project_config.return_value = mock_git_config
+
+            return GitRepository(Mock(spec=ProjectConfig))
+
+    def test_changed_files_match_git_output(self, git_repo):
+        """Test renames, deletions, binary and quoted unicode paths are parsed."""
+        with patch.object(
+            git_repo, "_git_output", wraps=git_repo._git_output
+        ) as mock_git_output:
+            changed = git_repo._get_changed_file_set(
+                "feature", "main", include_patch=True
+            )
+
+        files = {f.path: f for f in changed.files}
+        unicode_path = 'ünïcode "quoted".txt'
+        assert sorted(files) == sorted(
+            ["gone.py", "image.bin", "keep.py", "new name.py", unicode_path]
+        )
+        assert {path: f.status for path, f in files.items()} == {
+            "gone.py": "D",
+            "image.bin": "A",
+            "keep.py": "M",
+            "new name.py": "R",
+            unicode_path: "A",
+        }
+        assert (files["keep.py"].insertions, files["keep.py"].deletions) == (2, 1)
+        assert (files["new name.py"].insertions, files["new name.py"].deletions) == (
+            1,
+            0,
+        )
+        assert files["image.bin"].binary
+        assert files["image.bin"].patch is None
+
+        for path in ["gone.py", "keep.py", "new name.py", unicode_path]:
+            assert files[path].patch is not None
+            assert files[path].patch.startswith("diff --git ")
+        assert "+b = 3" in files["keep.py"].patch
+        assert "+hello" in files[unicode_path].patch
+
+        # Every patch was found in the combined diff; no per-file fallback ran
+        per_file_diffs = [
+            call for call in mock_git_output.call_args_list if "--" in call.args[0]
+        ]
+        assert per_file_diffs == []
@@ -0,0 +1,27 @@
+import pytest
+
+from integrations.llm.llm import _get_agent, invoke_llm, invoke_llm_async
+
+
+class TestInvokeLlm:
+    """Test cases for invoke_llm and invoke_llm_async."""
+
+    def setup_method(self):
+        """Start each test with an empty agent cache."""
+        _get_agent.cache_clear()
+
+    @pytest.mark.asyncio
+    async def test_agent_is_reused_across_calls(self):
+        """Test that sync and async calls share one agent per model."""
+        assert await invoke_llm_async("first", "test") == "success (no tool calls)"
+        assert await invoke_llm_async("second", "test") == "success (no tool calls)"
+
+        info = _get_agent.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_sync_call_uses_cached_agent(self):
+        """Test that invoke_llm returns the model output from the cached agent."""
+        agent = _get_agent("test")
+
+        assert invoke_llm("hello", "test") == "success (no tool calls)"
+        assert _get_agent("test") is agent
@@ -0,0 +1,182 @@
+from unittest.mock import MagicMock, patch
+import threading
+
+import pytest
+
+from integrations.slack.slack_client_service import SlackClientService
+from integrations.slack.user_name_cache import UserNameCache
+
+
+class TestReplaceUserMentions:
+    """Test cases for replace_user_mentions_with_names."""
+
+    @pytest.fixture
+    def service(self) -> SlackClientService:
+        """Create SlackClientService with a mocked WebClient."""
+        with patch.object(SlackClientService, "__init__", lambda _self: None):
+            svc = SlackClientService()
+            svc.log = MagicMock()
+            svc.client = MagicMock()
+            svc.user_name_cache = UserNameCache()
+            svc._canvas_user_ids = set()
+            svc._canvas_users_lock = threading.Lock()
+            svc.client.users_info.side_effect = lambda user: {
+                "user": {"real_name": f"Name {user}"}
+            }
+            return svc
+
+    def test_mentions_are_replaced_with_names(
+        self, service: SlackClientService
+    ) -> None:
+        """Each mention becomes @Real Name <ID>."""
+        result = service.replace_user_mentions_with_names("hi <@U1> and <@U2>")
+
+        assert result == "hi @Name U1 <U1> and @Name U2 <U2>"
+
+    def test_text_without_mentions_skips_lookups(
+        self, service: SlackClientService
+    ) -> None:
+        """Plain text is returned unchanged without any users_info call."""
+        assert service.replace_user_mentions_with_names("no mentions") == "no mentions"
+        service.client.users_info.assert_not_called()
+
+    def test_failed_lookup_keeps_original_mention(
+        self, service: SlackClientService
+    ) -> None:
+        """A mention whose user cannot be resolved is left as is."""
+        service.client.users_info.side_effect = RuntimeError("boom")
+
+        assert service.replace_user_mentions_with_names("hi <@U1>") == "hi <@U1>"
+
+    def test_each_user_is_looked_up_once(self, service: SlackClientService) -> None:
+        """Repeated and cached mentions do not trigger extra lookups."""
+        service.user_name_cache.set("U3", "Cached")
+
+        result = service.replace_user_mentions_with_names("<@U1> <@U2> <@U1> <@U3>")
+
+        assert result == "@Name U1 <U1> @Name U2 <U2> @Name U1 <U1> @Cached <U3>"
+        looked_up = sorted(
+            call.kwargs["user"] for call in service.client.users_info.call_args_list
+        )
+        assert looked_up == ["U1", "U2"]
+
+    def test_failed_parallel_lookup_keeps_only_that_mention(
+        self, service: SlackClientService
+    ) -> None:
+        """One failing lookup does not affect the other mentions."""
+
+        def users_info(user: str) -> dict:
+            if user == "U2":
+                raise RuntimeError("boom")
+            return {"user": {"real_name": f"Name {user}"}}
+
+        service.client.users_info.side_effect = users_info
+
+        result = service.replace_user_mentions_with_names("<@U1> <@U2>")
+
+        assert result == "@Name U1 <U1> <@U2>"
+
+    def test_prefetch_resolves_authors_and_mentions(
+        self, service: SlackClientService
+    ) -> None:
+        """Thread authors and mentioned users are cached in one pass."""
+        messages = [
+            {"user": "U1", "text": "hi <@U2>"},
+            {"user": "U2", "text": "plain"},
+            {"text": "bot message without user"},
+        ]
+
+        service.prefetch_user_names(messages)
+
+        assert service.user_name_cache.get("U1") == "Name U1"
+        assert service.user_name_cache.get("U2") == "Name U2"
+        assert service.client.users_info.call_count == 2
+
+    def test_failed_author_lookup_uses_fallback_username(
+        self, service: SlackClientService
+    ) -> None:
+        """An unresolvable author falls back to the given username."""
+        service.bot_id = "BOT123"
+        service.client.users_info.side_effect = RuntimeError("boom")
+
+        message = service.create_slack_message_from_api(
+            {"ts": "1700000000.000100", "user": "U1", "text": "hello"},
+            "C1",
+            fallback_username="someone",
+        )
+
+        assert message.username == "someone"
+        assert message.content == "hello"
+
+    def test_cached_names_are_read_once(self, service: SlackClientService) -> None:
+        """Resolving a cached user reads the cache a single time."""
+        service.user_name_cache = MagicMock()
+        service.user_name_cache.get.return_value = "Cached"
+
+        assert service.replace_user_mentions_with_names("<@U1>") == "@Cached <U1>"
+        service.user_name_cache.get.assert_called_once_with("U1")
+        service.client.users_info.assert_not_called()
+
+    def test_canvas_access_outlives_name_cache_entries(
+        self, service: SlackClientService
+    ) -> None:
+        """Canvases are shared with every resolved user, even if evicted."""
+        service.user_name_cache = UserNameCache(max_size=1)
+        service.replace_user_mentions_with_names("<@U1> <@U2>")
+        assert service.get_user_real_name("U3") == "Name U3"
+        assert service.user_name_cache.user_ids() == ["U3"]
+
+        service.client.canvases_create.return_value = {"canvas_id": "F1"}
+        service.client.files_info.return_value = {"file": {"permalink": "https://x"}}
+        assert service.post_canvas("C1", markdown_content="notes") == "F1"
+
+        access = service.client.canvases_access_set.call_args.kwargs
+        assert sorted(access["user_ids"]) == ["U1", "U2", "U3"]
+
+
+class TestSocketClientLifecycle:
+    """Test cases for starting and stopping the Socket Mode client."""
+
+    @pytest.fixture
+    def service(self) -> SlackClientService:
+        """Create SlackClientService with a mocked Socket Mode client."""
+        with patch.object(SlackClientService, "__init__", lambda _self: None):
+            svc = SlackClientService()
+            svc.log = MagicMock()
+            svc.socket_client = MagicMock()
+            svc._socket_thread = None
+            svc._socket_stop = threading.Event()
+            return svc
+
+    def test_failed_connect_is_retried(self, service: SlackClientService) -> None:
+        """A failing initial connection is retried until it succeeds."""
+        service.socket_client.connect.side_effect = [OSError("down"), None]
+
+        with patch(
+            "integrations.slack.slack_client_service._SOCKET_CONNECT_INITIAL_BACKOFF",
+            0.01,
+        ):
+            service.start_socket_client()
+            service._socket_thread.join(timeout=5)
+
+        assert service.socket_client.connect.call_count == 2
+
+    def test_stop_ends_retries_and_closes_client(
+        self, service: SlackClientService
+    ) -> None:
+        """Stopping interrupts the back-off wait and closes the client."""
+        attempted = threading.Event()
+
+        def connect() -> None:
+            attempted.set()
+            raise OSError("down")
+
+        service.socket_client.connect.side_effect = connect
+
+        service.start_socket_client()
+        assert attempted.wait(timeout=5)
+        service.stop_socket_client()
+
+        assert not service._socket_thread.is_alive()
+        service.socket_client.close.assert_called_once()
+        assert service.socket_client.connect.call_count == 1
@@ -0,0 +1,110 @@
+from typing import Any
+from unittest.mock import Mock, patch
+
+from core.storage import BaseStorage
+from integrations.slack.models import SlackBotConfig
+from integrations.slack.user_name_cache import UserNameCache
+
+
+class TestUserNameCache:
+    """Test cases for UserNameCache."""
+
+    def test_get_returns_cached_name(self) -> None:
+        """A stored name is returned until it expires."""
+        cache = UserNameCache()
+        cache.set("U1", "Alice")
+
+        assert cache.get("U1") == "Alice"
+        assert cache.get("U2") is None
+
+    def test_entries_expire_after_ttl(self) -> None:
+        """Expired entries are treated as missing and dropped."""
+        cache = UserNameCache(ttl_seconds=60)
+        with patch("integrations.slack.user_name_cache.time.monotonic") as clock:
+            clock.return_value = 1000.0
+            cache.set("U1", "Alice")
+
+            clock.return_value = 1059.0
+            assert cache.get("U1") == "Alice"
+
+            clock.return_value = 1060.0
+            assert cache.get("U1") is None
+            assert cache.user_ids() == []
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        """Exceeding max_size drops the entry used longest ago."""
+        cache = UserNameCache(max_size=2)
+        cache.set("U1", "Alice")
+        cache.set("U2", "Bob")
+        cache.get("U1")
+
+        cache.set("U3", "Carol")
+
+        assert cache.user_ids() == ["U1", "U3"]
+
+
+class DictStorage(BaseStorage):
+    """In-memory storage for testing."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        self.data[key] = value
+
+    def delete(self, key: str) -> bool:
+        return self.data.pop(key, None) is not None
+
+
+class TestPersistentUserNameCache:
+    """Test cases for UserNameCache backed by storage."""
+
+    def test_names_survive_a_new_cache_instance(self) -> None:
+        """A name stored by one cache is found by a fresh one."""
+        storage = DictStorage()
+        UserNameCache(storage=storage).set("U1", "Alice")
+
+        restarted = UserNameCache(storage=storage)
+
+        assert restarted.get("U1") == "Alice"
+        assert restarted.user_ids() == ["U1"]
+
+    def test_expired_persisted_names_are_ignored(self) -> None:
+        """Persisted entries past their expiry are treated as missing."""
+        storage = DictStorage()
+        storage.set("slack_user_U1", {"real_name": "Alice", "expires_at": 0})
+
+        assert UserNameCache(storage=storage).get("U1") is None
+        assert storage.data == {}
+
+    def test_evicted_names_are_removed_from_storage(self) -> None:
+        """The persisted tier is bounded by max_size like the memory tier."""
+        storage = DictStorage()
+        cache = UserNameCache(max_size=1, storage=storage)
+        cache.set("U1", "Alice")
+        cache.set("U2", "Bob")
+
+        assert list(storage.data) == ["slack_user_U2"]
+
+
+class TestPersistUserNamesSetting:
+    """Test cases for the slack.bot.persistUserNames setting."""
+
+    def test_persistence_is_off_by_default(self) -> None:
+        """Without configuration, user names are not persisted."""
+        base_config = Mock()
+        base_config.get_value.side_effect = lambda _key, default=None: default
+
+        assert SlackBotConfig(base_config).get_persist_user_names() is False
+
+    def test_persistence_can_be_enabled(self) -> None:
+        """A truthy string value enables persistence."""
+        base_config = Mock()
+        base_config.get_value.side_effect = lambda key, default=None: (
+            "true" if key == "slack.bot.persistUserNames" else default
+        )
+
+        assert SlackBotConfig(base_config).get_persist_user_names() is True